@@ -1,36 +1,46 @@
 import os
 import logging
 import requests
+import orjson
 
 logger = logging.getLogger("primary_logger")
 
 
 class DbtClient:
 
-    def __init__(self, access_token: str, account_id: str):
+    def __init__(
+        self, access_token: str, account_id: str, session: requests.Session = None
+    ):
         self.access_token = access_token
         self.account_id = account_id
         self.headers = {"Authorization": f"Bearer {access_token}"}
         self.account_url = f"https://cloud.getdbt.com/api/v2/accounts/{account_id}"
         self.base_url = "https://cloud.getdbt.com/api/v2"
+        # A shared session is used as is, so the caller sets its Authorization
+        # header once rather than each client updating it
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+        self.session = session
 
     def _request(self, url, data=None, params=None, method="GET"):
-        request_details = {"headers": self.headers}
+        request_details = {}
         if data:
             request_details["data"] = data
         if params:
             request_details["params"] = params
 
         try:
-            response = requests.request(method, url, **request_details)
-            if response.ok:
-                return response.json()
+            response = self.session.request(method, url, **request_details)
+            # Fail on an error status before touching the body
+            response.raise_for_status()
+            return orjson.loads(response.content)
         except Exception as e:
-            logger.exception(f"Error in making request to {url}: {e}")
+            logger.exception("Error in making request to %s: %s", url, e)
             raise
 
     def trigger_job(self, job_id):
-        logger.info(f"Triggering dbt job {job_id} on account {self.account_id}")
+        logger.info("Triggering dbt job %s on account %s", job_id, self.account_id)
 
         response = self._request(
             f"{self.account_url}/jobs/{job_id}/run/",
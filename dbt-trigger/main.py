@@ -3,14 +3,50 @@ import functions_framework
 from dbt_client import DbtClient
 import logging
 import sys
-import os
-import json
-from requests import auth, Session
-import time
-
+from requests import adapters, Session
+from urllib3.util.retry import Retry
+import orjson
 
 logger = logging.getLogger("primary_logger")
 logger.propagate = False
+logging_configured = False
+
+# Create a global HTTP session (which provides connection pooling)
+session = Session()
+# Rate-limited (429) calls are retried with jittered exponential backoff, honoring Retry-After.
+# Connection and read errors are not retried, since a POST may already have started a run.
+session.mount(
+    "https://",
+    adapters.HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            connect=0,
+            read=0,
+            other=0,
+            status=5,
+            status_forcelist=[429],
+            allowed_methods=None,
+            backoff_factor=1,
+            backoff_jitter=1,
+            backoff_max=60,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    ),
+)
+# dbt Cloud account that owns the triggered jobs
+DBT_ACCOUNT_ID = "10206"
+dbt_token = None
+
+
+def init():
+    global dbt_token
+    # Secrets only change on redeploy, so read them once per instance
+    if dbt_token is None:
+        dbt_token = os.environ["DBT_TOKEN"]
+        session.headers["Authorization"] = f"Bearer {dbt_token}"
 
 
 class CloudLoggingFormatter(logging.Formatter):
@@ -19,26 +55,38 @@ class CloudLoggingFormatter(logging.Formatter):
     """
 
     def format(self, record: logging.LogRecord) -> str:
-        s = super().format(record)
-        return json.dumps(
+        # A plain record is its own message
+        if (
+            self._fmt == "%(message)s"
+            and not record.args
+            and not record.exc_info
+            and not record.stack_info
+        ):
+            s = str(record.msg)
+        else:
+            s = super().format(record)
+        return orjson.dumps(
             {
                 "message": s,
                 "severity": record.levelname,
-                "timestamp": {"seconds": int(record.created), "nanos": 0},
+                "timestampSeconds": int(record.created),
+                "timestampNanos": 0,
             }
-        )
+        ).decode()
 
 
 def setup_logging():
     """
     Sets up logging for the application.
     """
-    global logger
+    global logger, logging_configured
+
+    # Warm instances reuse the configured handler across invocations
+    if logging_configured:
+        return
 
     # Remove any existing handlers
-    if logger.handlers:
-        for handler in logger.handlers:
-            logger.removeHandler(handler)
+    logger.handlers.clear()
 
     handler = logging.StreamHandler(stream=sys.stdout)
     formatter = CloudLoggingFormatter(fmt="%(message)s")
@@ -47,6 +95,7 @@ def setup_logging():
     logger.setLevel(logging.DEBUG)
 
     sys.excepthook = handle_unhandled_exception
+    logging_configured = True
 
 
 def handle_unhandled_exception(exc_type, exc_value, exc_traceback):
@@ -78,6 +127,7 @@ def trigger_dbt_job(request):
 
     """
     setup_logging()
+    init()
 
     request_json = request.get_json(silent=True)
 
@@ -86,31 +136,28 @@ def trigger_dbt_job(request):
         and request.headers.get("Content-Type") == "application/octet-stream"
     ):
         try:
-            request_data = request.get_data(as_text=True)
-            request_json = json.loads(request_data) if request_data else None
-        except Exception as e:
-            logger.exception(f"Failed to parse octet-stream data: {str(e)}")
+            request_data = request.get_data()
+            request_json = orjson.loads(request_data) if request_data else None
+        except Exception:
+            logger.exception("Failed to parse octet-stream data")
             request_json = None
 
-    if request_json and "job_id" in request_json:
-        job_id = request_json["job_id"]
-    else:
-        logger.exception("Failed to retrieve job_id")
-        raise
+    job_id = request_json.get("job_id") if request_json else None
+    if job_id is None:
+        logger.error("Failed to retrieve job_id")
+        raise ValueError("Request is missing job_id")
 
-    dbt_token = os.environ["DBT_TOKEN"]
-    account_id = "10206"
     try:
-        client = DbtClient(access_token=dbt_token, account_id=account_id)
+        client = DbtClient(
+            access_token=dbt_token, account_id=DBT_ACCOUNT_ID, session=session
+        )
         job_run_response = client.trigger_job(job_id)
         run_id = job_run_response["data"]["id"]
         if run_id is None:
-            logger.exception(f"dbt run failed to start.")
+            logger.exception("dbt run failed to start.")
             return
-        logger.info(f"DBT run {run_id} started successfully.")
+        logger.info("DBT run %s started successfully.", run_id)
         return "Trigger dbt job completed", 200
-    except Exception as e:
-        logger.exception(
-            f"An error occurred when attempting to trigger dbt job: {str(e)}"
-        )
+    except Exception:
+        logger.exception("An error occurred when attempting to trigger dbt job")
         raise
@@ -1,10 +1,12 @@
 import pytest
 import responses
+from responses import registries
 import logging
 import sys
 from unittest import mock
 from flask import Request
 import main
+import orjson
 import requests
 
 
@@ -67,6 +69,39 @@ def test_trigger_dbt_job_success(mock_env_vars, mock_request_with_job_id, caplog
     ), f"Expected message not found in logs: {log_messages}"
     assert response[0] == "Trigger dbt job completed"
     assert response[1] == 200
+    assert responses.calls[0].request.headers["Authorization"] == (
+        "Bearer test_dbt_token"
+    )
+
+
+@responses.activate
+def test_trigger_dbt_job_raises_on_error_status_without_parsing_body(
+    mock_env_vars, mock_request_with_job_id
+):
+    """
+    Tests that an error response raises an HTTPError rather than failing on a non-JSON body.
+    """
+    responses.add(
+        responses.POST,
+        "https://cloud.getdbt.com/api/v2/accounts/10206/jobs/test_job_id/run/",
+        status=404,
+        body="<html>Not Found</html>",
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        main.trigger_dbt_job(mock_request_with_job_id)
+
+
+def test_dbt_client_leaves_shared_session_unchanged():
+    """
+    Tests that a client given a session does not change its headers.
+    """
+    session = requests.Session()
+    headers = dict(session.headers)
+
+    main.DbtClient(access_token="other_token", account_id="1", session=session)
+
+    assert dict(session.headers) == headers
 
 
 @responses.activate
@@ -153,3 +188,155 @@ def test_trigger_dbt_job_timeout(mock_env_vars, mock_request_with_job_id, caplog
         assert any(
             "Error in making request" in msg for msg in log_messages
         ), f"Expected error message not found in logs: {log_messages}"
+
+
+@responses.activate(registry=registries.OrderedRegistry)
+def test_trigger_dbt_job_retries_rate_limited_request(
+    mock_env_vars, mock_request_with_job_id
+):
+    """
+    Tests that a rate-limited (429) trigger is retried.
+    """
+    url = "https://cloud.getdbt.com/api/v2/accounts/10206/jobs/test_job_id/run/"
+    responses.add(responses.POST, url, status=429, headers={"Retry-After": "0"})
+    responses.add(responses.POST, url, json={"data": {"id": "test_run_id"}})
+
+    with mock.patch("time.sleep"):
+        response = main.trigger_dbt_job(mock_request_with_job_id)
+
+    assert response[1] == 200
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_trigger_dbt_job_does_not_retry_connection_error(
+    mock_env_vars, mock_request_with_job_id
+):
+    """
+    Tests that a trigger whose connection fails is not retried, since the run may have started.
+    """
+    responses.add(
+        responses.POST,
+        "https://cloud.getdbt.com/api/v2/accounts/10206/jobs/test_job_id/run/",
+        body=requests.exceptions.ConnectionError("Connection refused"),
+    )
+
+    with pytest.raises(Exception):
+        main.trigger_dbt_job(mock_request_with_job_id)
+
+    assert len(responses.calls) == 1
+    assert main.session.get_adapter("https://").max_retries.connect == 0
+
+
+@pytest.mark.parametrize("body", [None, {"job_id": None}, {"other": "value"}])
+def test_trigger_dbt_job_rejects_request_without_job_id(mock_env_vars, body):
+    """
+    Tests that a request without a job_id raises a ValueError.
+    """
+    mock_req = mock.Mock(spec=Request)
+    mock_req.get_json.return_value = body
+    mock_req.headers = {"Content-Type": "application/json"}
+
+    with pytest.raises(ValueError, match="Request is missing job_id"):
+        main.trigger_dbt_job(mock_req)
+
+
+def test_setup_logging_configures_once(monkeypatch):
+    """
+    Tests that setup_logging only configures the logger on its first call.
+    """
+    monkeypatch.setattr(main, "logging_configured", False)
+    monkeypatch.setattr(sys, "excepthook", sys.excepthook)
+    logger = logging.getLogger("primary_logger")
+
+    main.setup_logging()
+    handlers = list(logger.handlers)
+    main.setup_logging()
+
+    assert len(handlers) == 1
+    assert isinstance(handlers[0].formatter, main.CloudLoggingFormatter)
+    assert logger.handlers == handlers
+    assert main.logging_configured
+
+
+@responses.activate
+def test_trigger_dbt_job_reads_octet_stream_body(mock_env_vars):
+    """
+    Tests that the job_id is read from an application/octet-stream JSON body.
+    """
+    responses.add(
+        responses.POST,
+        "https://cloud.getdbt.com/api/v2/accounts/10206/jobs/test_job_id/run/",
+        json={"data": {"id": "test_run_id"}},
+    )
+    mock_req = mock.Mock(spec=Request)
+    mock_req.get_json.return_value = None
+    mock_req.headers = {"Content-Type": "application/octet-stream"}
+    mock_req.get_data.return_value = b'{"job_id": "test_job_id"}'
+
+    response = main.trigger_dbt_job(mock_req)
+
+    assert response == ("Trigger dbt job completed", 200)
+
+
+def test_trigger_dbt_job_rejects_malformed_octet_stream_body(mock_env_vars, caplog):
+    """
+    Tests that an octet-stream body that is not JSON is logged and rejected.
+    """
+    mock_req = mock.Mock(spec=Request)
+    mock_req.get_json.return_value = None
+    mock_req.headers = {"Content-Type": "application/octet-stream"}
+    mock_req.get_data.return_value = b"not json"
+
+    with pytest.raises(ValueError, match="Request is missing job_id"):
+        main.trigger_dbt_job(mock_req)
+
+    assert "Failed to parse octet-stream data" in [
+        record.message for record in caplog.records
+    ]
+
+
+def make_log_record(msg, args=None, exc_info=None):
+    return logging.LogRecord(
+        "primary_logger", logging.INFO, __file__, 1, msg, args, exc_info
+    )
+
+
+def test_cloud_logging_formatter_formats_plain_and_templated_records():
+    """
+    Tests that plain records skip Formatter.format and templated or exception records still use it.
+    """
+    formatter = main.CloudLoggingFormatter(fmt="%(message)s")
+
+    with mock.patch.object(logging.Formatter, "format") as base_format:
+        plain = orjson.loads(formatter.format(make_log_record("100% done")))
+    base_format.assert_not_called()
+    templated = orjson.loads(formatter.format(make_log_record("run %s", ("42",))))
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        failed = orjson.loads(
+            formatter.format(make_log_record("failed", exc_info=sys.exc_info()))
+        )
+
+    assert plain["message"] == "100% done"
+    assert templated["message"] == "run 42"
+    assert failed["message"].startswith("failed\nTraceback")
+    assert "ValueError: boom" in failed["message"]
+
+
+def test_cloud_logging_formatter_emits_flat_timestamp_fields():
+    """
+    Tests that records carry the flat severity and timestamp fields Cloud Logging reads.
+    """
+    record = make_log_record("hello")
+    record.created = 1700000000.75
+
+    entry = orjson.loads(main.CloudLoggingFormatter(fmt="%(message)s").format(record))
+
+    assert entry == {
+        "message": "hello",
+        "severity": "INFO",
+        "timestampSeconds": 1700000000,
+        "timestampNanos": 0,
+    }
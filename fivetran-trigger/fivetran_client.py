@@ -2,6 +2,7 @@ import time
 import logging
 import requests
 from requests.auth import HTTPBasicAuth
+import orjson
 
 logger = logging.getLogger("primary_logger")
 
@@ -14,10 +15,23 @@ class FivetranClient:
         api_key (str): The Fivetran API key
         api_secret (str): The Fivetran API secret
         auth (HTTPBasicAuth): The authentication object used for requests
+        session (requests.Session): The HTTP session used for requests, reused across calls
     """
 
-    def __init__(self, auth: HTTPBasicAuth) -> None:
+    headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json;version=2",
+    }
+
+    def __init__(self, auth: HTTPBasicAuth, session: requests.Session = None) -> None:
         self.auth = auth
+        # A shared session is used as is, so the caller sets its credentials
+        # and headers once rather than each client updating them
+        if session is None:
+            session = requests.Session()
+            session.auth = auth
+            session.headers.update(self.headers)
+        self.session = session
 
     def _request(
         self, endpoint: str, method: str = "GET", payload: dict = None
@@ -38,23 +52,17 @@ class FivetranClient:
         """
 
         url = f"https://api.fivetran.com/v1/{endpoint}"
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json;version=2",
-        }
 
         try:
             if payload:
-                resp = requests.request(
-                    method, url, headers=headers, json=payload, auth=self.auth
-                )
+                resp = self.session.request(method, url, json=payload)
             else:
-                resp = requests.request(method, url, headers=headers, auth=self.auth)
+                resp = self.session.request(method, url)
 
             resp.raise_for_status()
-            return resp.json()
+            return orjson.loads(resp.content)
         except requests.exceptions.RequestException as e:
-            logger.exception(f"Error: {e.response.status_code} - {e.response.text}")
+            logger.exception("Error: %s - %s", e.response.status_code, e.response.text)
             raise
 
     def trigger_sync(
@@ -71,7 +79,7 @@ class FivetranClient:
             connector_id (str): The ID of the connector
             force (bool): Whether to force the sync. Defaults to True.
             wait_for_completion (bool): Whether to wait for the sync to complete. Defaults to False.
-            poke_interval (int): Interval in seconds to check for sync completion. Defaults to 30.
+            poke_interval (int): Maximum interval in seconds between checks for sync completion. Defaults to 30.
 
         Raises:
             ExitCodeException: If an error occurs while triggering sync.
@@ -85,7 +93,9 @@ class FivetranClient:
                 connector_id
             )
             logger.info(
-                f"The last success was {prev_success or 'never'} and the last failure was {prev_failure or 'never'}"
+                "The last success was %s and the last failure was %s",
+                prev_success or "never",
+                prev_failure or "never",
             )
 
         try:
@@ -95,28 +105,48 @@ class FivetranClient:
                 payload={"force": force},
             )
         except Exception as e:
-            logger.exception(f"Error triggering sync: {e}")
+            logger.exception("Error triggering sync: %s", e)
             raise
         else:
             if wait_for_completion:
                 new_success, new_failure = prev_success, prev_failure
+                poll_count = 0
                 while prev_success == new_success and prev_failure == new_failure:
                     logger.info("Waiting for sync to complete...")
-                    time.sleep(poke_interval)
+                    time.sleep(self._next_poll_delay(poll_count, poke_interval))
+                    poll_count += 1
                     new_success, new_failure = self._get_latest_success_and_failure(
                         connector_id
                     )
 
-                logger.info("Sync completed")
-                logger.info("Checking for new failure")
+                logger.info(
+                    "Sync completed for connector %s, checking for new failure",
+                    connector_id,
+                )
                 if (prev_failure and new_failure != prev_failure) or (
                     not prev_failure and new_failure
                 ):
-                    logger.exception(f"Sync failed at {new_failure}")
+                    logger.exception("Sync failed at %s", new_failure)
                     raise
                 else:
                     logger.info("No new failure detected")
 
+    @staticmethod
+    def _next_poll_delay(poll_count: int, poke_interval: int) -> int:
+        """
+        Internal method to get the delay before the next sync status check.
+
+        Delays double from 2 seconds so short syncs are noticed quickly, then settle at poke_interval for long ones.
+
+        Parameters:
+            poll_count (int): The number of status checks already made.
+            poke_interval (int): The maximum delay in seconds.
+
+        Returns:
+            int: The delay in seconds.
+        """
+        return min(poke_interval, 2 ** min(poll_count + 1, 16))
+
     def determine_sync_status(self, connector_id: str) -> str:
         """
         Determine the sync status of a specific connector.
@@ -137,7 +167,7 @@ class FivetranClient:
             )
             return response.get("data", {}).get("status", {}).get("sync_state")
         except Exception as e:
-            logger.exception(f"Error determining sync status: {e}")
+            logger.exception("Error determining sync status: %s", e)
             raise
 
     def get_connector_details(self, connector_id: str) -> dict:
@@ -160,7 +190,7 @@ class FivetranClient:
             )
             return response.get("data", {})
         except Exception as e:
-            logger.exception(f"Error getting connector details: {e}")
+            logger.exception("Error getting connector details: %s", e)
             raise
 
     def _get_latest_success_and_failure(self, connector_id: str) -> tuple:
@@ -213,7 +243,7 @@ class FivetranClient:
             try:
                 self._request(endpoint, method="PATCH", payload=payload)
             except Exception as e:
-                logger.exception(f"Error updating connector: {e}")
+                logger.exception("Error updating connector: %s", e)
                 raise
         else:
             logger.exception("No updates to connector were provided")
@@ -232,5 +262,5 @@ class FivetranClient:
             logger.info("Connection Validated")
             return 0
         except Exception as e:
-            logger.exception(f"Error connecting to Fivetran: {e}")
+            logger.exception("Error connecting to Fivetran: %s", e)
             return 1
@@ -3,21 +3,49 @@ import functions_framework
 from fivetran_client import FivetranClient
 import logging
 import sys
-import os
-import json
-from requests import auth, Session
+from requests import adapters, auth, Session
+from urllib3.util.retry import Retry
+import orjson
 
 logger = logging.getLogger("primary_logger")
 logger.propagate = False
+logging_configured = False
 
 # Create a global HTTP session (which provides connection pooling)
 session = Session()
+# Rate-limited (429) calls are retried with jittered exponential backoff, honoring Retry-After.
+# Connection and read errors are not retried, since a POST may already have started a run.
+session.mount(
+    "https://",
+    adapters.HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            connect=0,
+            read=0,
+            other=0,
+            status=5,
+            status_forcelist=[429],
+            allowed_methods=None,
+            backoff_factor=1,
+            backoff_jitter=1,
+            backoff_max=60,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    ),
+)
+session.headers.update(FivetranClient.headers)
 basic_auth = None
 
 
 def init():
     global basic_auth
-    basic_auth = auth.HTTPBasicAuth(env_var("API_KEY"), env_var("API_SECRET"))
+    # Secrets only change on redeploy, so read them once per instance
+    if basic_auth is None:
+        basic_auth = auth.HTTPBasicAuth(env_var("API_KEY"), env_var("API_SECRET"))
+        session.auth = basic_auth
 
 
 def env_var(name):
@@ -30,26 +58,38 @@ class CloudLoggingFormatter(logging.Formatter):
     """
 
     def format(self, record: logging.LogRecord) -> str:
-        s = super().format(record)
-        return json.dumps(
+        # A plain record is its own message
+        if (
+            self._fmt == "%(message)s"
+            and not record.args
+            and not record.exc_info
+            and not record.stack_info
+        ):
+            s = str(record.msg)
+        else:
+            s = super().format(record)
+        return orjson.dumps(
             {
                 "message": s,
                 "severity": record.levelname,
-                "timestamp": {"seconds": int(record.created), "nanos": 0},
+                "timestampSeconds": int(record.created),
+                "timestampNanos": 0,
             }
-        )
+        ).decode()
 
 
 def setup_logging():
     """
     Sets up logging for the application.
     """
-    global logger
+    global logger, logging_configured
+
+    # Warm instances reuse the configured handler across invocations
+    if logging_configured:
+        return
 
     # Remove any existing handlers
-    if logger.handlers:
-        for handler in logger.handlers:
-            logger.removeHandler(handler)
+    logger.handlers.clear()
 
     handler = logging.StreamHandler(stream=sys.stdout)
     formatter = CloudLoggingFormatter(fmt="%(message)s")
@@ -58,6 +98,7 @@ def setup_logging():
     logger.setLevel(logging.DEBUG)
 
     sys.excepthook = handle_unhandled_exception
+    logging_configured = True
 
 
 def handle_unhandled_exception(exc_type, exc_value, exc_traceback):
@@ -98,24 +139,24 @@ def trigger_sync(request):
         and request.headers.get("Content-Type") == "application/octet-stream"
     ):
         try:
-            request_data = request.get_data(as_text=True)
-            request_json = json.loads(request_data) if request_data else None
-        except Exception as e:
-            logger.exception(f"Failed to parse octet-stream data: {str(e)}")
+            request_data = request.get_data()
+            request_json = orjson.loads(request_data) if request_data else None
+        except Exception:
+            logger.exception("Failed to parse octet-stream data")
             request_json = None
 
-    if request_json and "connector_id" in request_json:
-        connector_id = request_json["connector_id"]
-    else:
-        logger.exception("Failed to retrieve connector_id")
-        raise
+    connector_id = request_json.get("connector_id") if request_json else None
+    if connector_id is None:
+        logger.error("Failed to retrieve connector_id")
+        raise ValueError("Request is missing connector_id")
 
-    client = FivetranClient(basic_auth)
+    client = FivetranClient(basic_auth, session=session)
 
     try:
         client.update_connector(connector_id=connector_id, schedule_type="manual")
         logger.info(
-            f"Connector updated successfully, schedule_type: manual, connector_id: {connector_id}"
+            "Connector updated successfully, schedule_type: manual, connector_id: %s",
+            connector_id,
         )
         client.trigger_sync(
             connector_id=connector_id,
@@ -123,11 +164,12 @@ def trigger_sync(request):
             wait_for_completion=False,
         )
         logger.info(
-            f"Fivetran sync triggered and completed successfully, connector_id: {connector_id}"
+            "Fivetran sync triggered and completed successfully, connector_id: %s",
+            connector_id,
         )
         return "Fivetran sync triggered successfully", 200
-    except Exception as e:
+    except Exception:
         logger.exception(
-            f"connector_id: {connector_id} - Error triggering Fivetran sync: {str(e)}"
+            "connector_id: %s - Error triggering Fivetran sync", connector_id
         )
         raise
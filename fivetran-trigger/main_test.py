@@ -1,8 +1,11 @@
 import pytest
 import responses
+from responses import registries
 from unittest import mock
 from flask import Request
 import main
+import orjson
+import requests
 import logging
 import sys
 
@@ -76,6 +79,22 @@ def test_trigger_sync_success(mock_env_vars, mock_request_with_connector, caplog
     ), f"Expected message not found in logs: {log_messages}"
     assert response[0] == "Fivetran sync triggered successfully"
     assert response[1] == 200
+    request = responses.calls[0].request
+    assert request.headers["Authorization"].startswith("Basic ")
+    assert request.headers["Accept"] == "application/json;version=2"
+
+
+def test_fivetran_client_leaves_shared_session_unchanged():
+    """
+    Tests that a client given a session does not change its credentials or headers.
+    """
+    session = requests.Session()
+    headers = dict(session.headers)
+
+    main.FivetranClient(requests.auth.HTTPBasicAuth("key", "secret"), session=session)
+
+    assert session.auth is None
+    assert dict(session.headers) == headers
 
 
 @responses.activate
@@ -117,3 +136,164 @@ def test_trigger_sync_invalid_credentials(
         assert any(
             "Error triggering Fivetran sync" in msg for msg in log_messages
         ), f"Expected error message not found in logs: {log_messages}"
+
+
+@responses.activate(registry=registries.OrderedRegistry)
+def test_trigger_sync_retries_rate_limited_request(
+    mock_env_vars, mock_request_with_connector
+):
+    """
+    Tests that a rate-limited (429) call is retried.
+    """
+    url = "https://api.fivetran.com/v1/connectors/test_connector_id"
+    responses.add(responses.PATCH, url, status=429, headers={"Retry-After": "0"})
+    responses.add(responses.PATCH, url, json={"data": {}})
+    responses.add(responses.POST, f"{url}/force", json={"data": {}})
+
+    with mock.patch("time.sleep"):
+        response = main.trigger_sync(mock_request_with_connector)
+
+    assert response[1] == 200
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_trigger_sync_does_not_retry_connection_error(
+    mock_env_vars, mock_request_with_connector
+):
+    """
+    Tests that a call whose connection fails is not retried, since the sync may have started.
+    """
+    responses.add(
+        responses.PATCH,
+        "https://api.fivetran.com/v1/connectors/test_connector_id",
+        body=requests.exceptions.ConnectionError("Connection refused"),
+    )
+
+    with pytest.raises(Exception):
+        main.trigger_sync(mock_request_with_connector)
+
+    assert len(responses.calls) == 1
+    assert main.session.get_adapter("https://").max_retries.connect == 0
+
+
+def test_fivetran_client_poll_delay_doubles_up_to_poke_interval():
+    """
+    Tests the delays between sync status checks when waiting for completion.
+    """
+    delays = [main.FivetranClient._next_poll_delay(n, 30) for n in range(6)]
+
+    assert delays == [2, 4, 8, 16, 30, 30]
+    assert main.FivetranClient._next_poll_delay(100, 600) == 600
+
+
+@pytest.mark.parametrize("body", [None, {"connector_id": None}, {"other": "value"}])
+def test_trigger_sync_rejects_request_without_connector_id(mock_env_vars, body):
+    """
+    Tests that a request without a connector_id raises a ValueError.
+    """
+    mock_req = mock.Mock(spec=Request)
+    mock_req.get_json.return_value = body
+    mock_req.headers = {"Content-Type": "application/json"}
+
+    with pytest.raises(ValueError, match="Request is missing connector_id"):
+        main.trigger_sync(mock_req)
+
+
+def test_setup_logging_configures_once(monkeypatch):
+    """
+    Tests that setup_logging only configures the logger on its first call.
+    """
+    monkeypatch.setattr(main, "logging_configured", False)
+    monkeypatch.setattr(sys, "excepthook", sys.excepthook)
+    logger = logging.getLogger("primary_logger")
+
+    main.setup_logging()
+    handlers = list(logger.handlers)
+    main.setup_logging()
+
+    assert len(handlers) == 1
+    assert isinstance(handlers[0].formatter, main.CloudLoggingFormatter)
+    assert logger.handlers == handlers
+    assert main.logging_configured
+
+
+@responses.activate
+def test_trigger_sync_reads_octet_stream_body(mock_env_vars):
+    """
+    Tests that the connector_id is read from an application/octet-stream JSON body.
+    """
+    url = "https://api.fivetran.com/v1/connectors/test_connector_id"
+    responses.add(responses.PATCH, url, json={"data": {}})
+    responses.add(responses.POST, f"{url}/force", json={"data": {}})
+    mock_req = mock.Mock(spec=Request)
+    mock_req.get_json.return_value = None
+    mock_req.headers = {"Content-Type": "application/octet-stream"}
+    mock_req.get_data.return_value = b'{"connector_id": "test_connector_id"}'
+
+    response = main.trigger_sync(mock_req)
+
+    assert response == ("Fivetran sync triggered successfully", 200)
+
+
+def test_trigger_sync_rejects_malformed_octet_stream_body(mock_env_vars, caplog):
+    """
+    Tests that an octet-stream body that is not JSON is logged and rejected.
+    """
+    mock_req = mock.Mock(spec=Request)
+    mock_req.get_json.return_value = None
+    mock_req.headers = {"Content-Type": "application/octet-stream"}
+    mock_req.get_data.return_value = b"not json"
+
+    with pytest.raises(ValueError, match="Request is missing connector_id"):
+        main.trigger_sync(mock_req)
+
+    assert "Failed to parse octet-stream data" in [
+        record.message for record in caplog.records
+    ]
+
+
+def make_log_record(msg, args=None, exc_info=None):
+    return logging.LogRecord(
+        "primary_logger", logging.INFO, __file__, 1, msg, args, exc_info
+    )
+
+
+def test_cloud_logging_formatter_formats_plain_and_templated_records():
+    """
+    Tests that plain records skip Formatter.format and templated or exception records still use it.
+    """
+    formatter = main.CloudLoggingFormatter(fmt="%(message)s")
+
+    with mock.patch.object(logging.Formatter, "format") as base_format:
+        plain = orjson.loads(formatter.format(make_log_record("100% done")))
+    base_format.assert_not_called()
+    templated = orjson.loads(formatter.format(make_log_record("run %s", ("42",))))
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        failed = orjson.loads(
+            formatter.format(make_log_record("failed", exc_info=sys.exc_info()))
+        )
+
+    assert plain["message"] == "100% done"
+    assert templated["message"] == "run 42"
+    assert failed["message"].startswith("failed\nTraceback")
+    assert "ValueError: boom" in failed["message"]
+
+
+def test_cloud_logging_formatter_emits_flat_timestamp_fields():
+    """
+    Tests that records carry the flat severity and timestamp fields Cloud Logging reads.
+    """
+    record = make_log_record("hello")
+    record.created = 1700000000.75
+
+    entry = orjson.loads(main.CloudLoggingFormatter(fmt="%(message)s").format(record))
+
+    assert entry == {
+        "message": "hello",
+        "severity": "INFO",
+        "timestampSeconds": 1700000000,
+        "timestampNanos": 0,
+    }
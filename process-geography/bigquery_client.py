@@ -1,11 +1,46 @@
 import pandas as pd
-from typing import Optional, Dict, Union, List
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Optional, Dict, Union, List, Tuple
+from google.api_core import exceptions, retry
 from google.cloud import bigquery
 import google.auth
+import io
 import logging
+import uuid
 
 logger = logging.getLogger("primary_logger")
 
+_WRITE_DISPOSITIONS = {
+    "overwrite": bigquery.WriteDisposition.WRITE_TRUNCATE,
+    "append": bigquery.WriteDisposition.WRITE_APPEND,
+}
+
+# Resubmit a load job when BigQuery reports a transient server-side failure.
+# Each load has a fixed job ID, so a resubmission of a job BigQuery already
+# accepted is rejected as a duplicate rather than loading the rows twice.
+_TRANSIENT_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(
+        exceptions.ServerError, exceptions.TooManyRequests
+    ),
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=300.0,
+)
+
+_ARROW_TYPES = {
+    "STRING": pa.string(),
+    "INTEGER": pa.int64(),
+    "INT64": pa.int64(),
+    "FLOAT": pa.float64(),
+    "FLOAT64": pa.float64(),
+    "BOOLEAN": pa.bool_(),
+    "BOOL": pa.bool_(),
+    "DATE": pa.date32(),
+    "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+}
+
 
 class BigQueryClient:
     """
@@ -20,6 +55,9 @@ class BigQueryClient:
         self.credentials, _ = google.auth.default()
         self.project = project
         self.conn = bigquery.Client(credentials=self.credentials)
+        # Per-client caches, so they are released with the client
+        self._table_refs: Dict[Tuple[str, str], bigquery.TableReference] = {}
+        self._tuple_schemas: Dict[Tuple, Tuple[bigquery.SchemaField, ...]] = {}
 
     @property
     def email(self):
@@ -31,8 +69,9 @@ class BigQueryClient:
         dataset: str,
         table: str,
         upload_type: str,
-        schema: Optional[Union[List[List], Dict[str, str]]] = None,
-    ):
+        schema: Optional[Union[List[List], Tuple[Tuple], Dict[str, str]]] = None,
+        maximum_batch_size_mb: int = 500,
+    ) -> None:
         """Upload a pandas dataframe to a table in BigQuery
         Args:
             df: The dataframe to load
@@ -40,59 +79,289 @@ class BigQueryClient:
             table: The name of the table to write to
             upload_type: Whether to append to or replace the data. Choices are 'overwrite' and 'append'
             schema: The optional schema of the table to be loaded
+            maximum_batch_size_mb: The approximate in-memory size of each load job. Larger dataframes are split into several jobs
+        """
+        self.upload_from_arrow(
+            pa.Table.from_pandas(df, preserve_index=False),
+            dataset,
+            table,
+            upload_type,
+            schema,
+            maximum_batch_size_mb,
+        )
+
+    def upload_from_arrow(
+        self,
+        arrow_table: pa.Table,
+        dataset: str,
+        table: str,
+        upload_type: str,
+        schema: Optional[Union[List[List], Tuple[Tuple], Dict[str, str]]] = None,
+        maximum_batch_size_mb: int = 500,
+        wait: bool = True,
+    ) -> List[bigquery.LoadJob]:
+        """Upload an Arrow table to a table in BigQuery
+        Args:
+            arrow_table: The Arrow table to load
+            dataset: The name of the dataset in BigQuery to upload to
+            table: The name of the table to write to
+            upload_type: Whether to append to or replace the data. Choices are 'overwrite' and 'append'
+            schema: The optional schema of the table to be loaded
+            maximum_batch_size_mb: The approximate in-memory size of each load job. Larger tables are split into several jobs
+            wait: Whether to wait for the load jobs. When False, the jobs are returned for the caller to wait on; a first batch that later batches append to is still awaited
+
+        Returns: The load jobs still running, empty when wait is True
         """
         try:
-            dataset_ref = bigquery.DatasetReference(self.project, dataset)
-            table_ref = dataset_ref.table(table)
-            job_config = bigquery.LoadJobConfig()
-
-            if upload_type == "overwrite":
-                job_config.write_disposition = bigquery.WriteDisposition.WRITE_TRUNCATE
-            else:
-                job_config.write_disposition = bigquery.WriteDisposition.WRITE_APPEND
-            job_config.autodetect = True  # infer the schema
-            if schema:
-                job_config.autodetect = True
-                job_config.schema = self._format_schema(schema)
-            job = self.conn.load_table_from_dataframe(
-                df, table_ref, job_config=job_config
-            )
-            job.result()
-            logger.info(f"Dataframe uploaded to BigQuery {dataset}.{table}")
-            del df
+            table_ref = self._table_ref(dataset, table)
+            arrow_table = self._cast_to_schema(arrow_table, schema)
+            rows_per_batch = self._rows_per_batch(arrow_table, maximum_batch_size_mb)
+            job_id_prefix = f"{dataset}_{table}_{uuid.uuid4().hex}"
+            jobs = []
+            for offset in range(0, max(arrow_table.num_rows, 1), rows_per_batch):
+                job = self._start_load(
+                    arrow_table.slice(offset, rows_per_batch),
+                    table_ref,
+                    upload_type if offset == 0 else "append",
+                    f"{job_id_prefix}_{offset // rows_per_batch}",
+                )
+                if offset == 0 and arrow_table.num_rows > rows_per_batch:
+                    # The first batch may truncate the table, so it has to land before any appends
+                    job.result()
+                else:
+                    jobs.append(job)
+            if not wait:
+                return jobs
+            for job in jobs:
+                job.result()
+            logger.info("Data uploaded to BigQuery %s.%s", dataset, table)
+            return []
+        except exceptions.GoogleAPIError as e:
+            logger.error("BigQuery rejected the upload to %s.%s: %s", dataset, table, e)
+            raise
         except Exception as e:
             logger.exception(
-                f"An error occurred when attempting to upload to BigQuery: {str(e)}"
+                "An error occurred when attempting to upload to BigQuery: %s", e
             )
             raise
 
+    def _start_load(
+        self,
+        arrow_table: pa.Table,
+        table_ref: bigquery.TableReference,
+        upload_type: str,
+        job_id: str,
+    ) -> bigquery.LoadJob:
+        """Submit a Parquet load job for an Arrow table without waiting for it
+
+        Args:
+            arrow_table: The rows to load
+            table_ref: The table to load into
+            upload_type: Whether to append to or replace the data. Choices are 'overwrite' and 'append'
+            job_id: The ID of the load job, kept the same across resubmissions
+
+        Returns: The submitted load job
+
+        """
+        try:
+            return self._submit_load(arrow_table, table_ref, upload_type, job_id)
+        except exceptions.Conflict:
+            # An earlier attempt was accepted but its response was lost
+            logger.warning("Load job %s already exists, reattaching to it", job_id)
+            # The job runs in the location of its destination dataset, which
+            # need not be the client's default location
+            location = self.conn.get_dataset(
+                bigquery.DatasetReference(table_ref.project, table_ref.dataset_id)
+            ).location
+            return self.conn.get_job(job_id, location=location)
+
+    def copy_table(
+        self, dataset: str, source: str, destination: str, upload_type: str
+    ) -> bigquery.CopyJob:
+        """Start copying a table into another table in the same dataset without waiting for it
+
+        Args:
+            dataset: The name of the dataset in BigQuery holding both tables
+            source: The name of the table to copy
+            destination: The name of the table to write to
+            upload_type: Whether to append to or replace the data. Choices are 'overwrite' and 'append'
+
+        Returns: The submitted copy job
+
+        """
+        return self.conn.copy_table(
+            self._table_ref(dataset, source),
+            self._table_ref(dataset, destination),
+            job_config=bigquery.CopyJobConfig(
+                write_disposition=_WRITE_DISPOSITIONS.get(
+                    upload_type, bigquery.WriteDisposition.WRITE_APPEND
+                )
+            ),
+        )
+
+    def delete_table(self, dataset: str, table: str) -> None:
+        """Delete a table, if it exists
+
+        Args:
+            dataset: The name of the dataset in BigQuery holding the table
+            table: The name of the table to delete
+
+        """
+        self.conn.delete_table(self._table_ref(dataset, table), not_found_ok=True)
+
+    @_TRANSIENT_RETRY
+    def _submit_load(
+        self,
+        arrow_table: pa.Table,
+        table_ref: bigquery.TableReference,
+        upload_type: str,
+        job_id: str,
+    ) -> bigquery.LoadJob:
+        """Submit a Parquet load job, retrying transient failures with the same job ID"""
+        return self.conn.load_table_from_file(
+            self._to_parquet(arrow_table),
+            table_ref,
+            job_id=job_id,
+            job_config=self._build_load_config(upload_type),
+        )
+
+    def _table_ref(self, dataset: str, table: str) -> bigquery.TableReference:
+        """Reference to a table in this client's project, cached by (dataset, table)"""
+        table_ref = self._table_refs.get((dataset, table))
+        if table_ref is None:
+            table_ref = bigquery.TableReference(
+                bigquery.DatasetReference(self.project, dataset), table
+            )
+            self._table_refs[(dataset, table)] = table_ref
+        return table_ref
+
+    def _build_load_config(self, upload_type: str) -> bigquery.LoadJobConfig:
+        """Build the load job configuration for a Parquet upload
+
+        Args:
+            upload_type: Whether to append to or replace the data. Choices are 'overwrite' and 'append'
+
+        Returns: The load job configuration
+
+        """
+        return bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            write_disposition=_WRITE_DISPOSITIONS.get(
+                upload_type, bigquery.WriteDisposition.WRITE_APPEND
+            ),
+        )
+
+    def _cast_to_schema(
+        self,
+        arrow_table: pa.Table,
+        schema: Optional[Union[List[List], Tuple[Tuple], Dict[str, str]]] = None,
+    ) -> pa.Table:
+        """Cast the columns of an Arrow table to their types in the schema
+
+        Parquet is self-describing, so the column types of this table become the
+        table schema. Columns named in the schema are cast to their BigQuery
+        type; any other columns keep their current type.
+
+        Args:
+            arrow_table: The table to cast
+            schema: The optional schema of the table to be loaded
+
+        Returns: The Arrow table
+
+        """
+        if not schema:
+            return arrow_table
+        arrow_schema = arrow_table.schema
+        for field in self._format_schema(schema):
+            index = arrow_schema.get_field_index(field.name)
+            if index == -1:
+                raise ValueError(
+                    f"Schema contains a field not present in the data: {field.name}"
+                )
+            arrow_type = _ARROW_TYPES.get(field.field_type)
+            if arrow_type is None:
+                raise ValueError(
+                    f"Unsupported type {field.field_type} for schema field {field.name}"
+                )
+            if arrow_schema.field(index).type != arrow_type:
+                arrow_schema = arrow_schema.set(index, pa.field(field.name, arrow_type))
+        return arrow_table.cast(arrow_schema)
+
+    @staticmethod
+    def _rows_per_batch(arrow_table: pa.Table, maximum_batch_size_mb: int) -> int:
+        """Number of rows that fit in a load job of the given in-memory size"""
+        bytes_per_row = arrow_table.nbytes / max(1, arrow_table.num_rows)
+        return max(1, int(maximum_batch_size_mb * 1024 * 1024 / max(1, bytes_per_row)))
+
+    @staticmethod
+    def _to_parquet(arrow_table: pa.Table) -> io.BytesIO:
+        """Serialize an Arrow table to an in-memory Parquet file
+
+        Args:
+            arrow_table: The table to serialize
+
+        Returns: The Parquet file, positioned at the start
+
+        """
+        parquet_file = io.BytesIO()
+        pq.write_table(
+            arrow_table,
+            parquet_file,
+            compression="snappy",
+            row_group_size=100_000,
+            use_dictionary=True,
+        )
+        parquet_file.seek(0)
+        return parquet_file
+
     def _format_schema(
-        self, schema: Union[List[List[str]], Dict[str, List[str]]]
+        self, schema: Union[List[List[str]], Tuple[Tuple[str]], Dict[str, List[str]]]
     ) -> List[bigquery.SchemaField]:
         """Helper function to format the schema appropriately for BigQuery
 
         Args:
-            schema: The representation inputted as either a list of lists (for backwards compatibility) or preferably JSON
+            schema: The representation inputted as either a list of lists (for backwards compatibility), a tuple of tuples or preferably JSON
 
         Returns: The formatted schema
 
         """
-        formatted_schema = []
         try:
-            for item in schema:
-                if isinstance(item, list):
-                    formatted_schema.append(bigquery.SchemaField(*item))
-                elif isinstance(item, dict):
-                    formatted_schema.append(bigquery.SchemaField.from_api_repr(item))
-                else:
-                    logger.exception(
-                        "Format of inputted schema is incorrect, this should preferably be a JSON representation or a List of Lists. For additional information and examples, visit https://cloud.google.com/bigquery/docs/schemas#specifying_a_json_schema_file"
-                    )
-                    raise
+            if type(schema) is tuple:
+                return list(self._format_tuple_schema(schema))
+            return [self._format_schema_field(item) for item in schema]
         except Exception as e:
             logger.exception(
-                f"Error in preparing the inputted schema to the approrpriate BigQuery format: {str(e)}"
+                "Error in preparing the inputted schema to the approrpriate BigQuery format: %s",
+                e,
             )
             raise
-        else:
-            return formatted_schema
+
+    def _format_tuple_schema(
+        self, schema: Tuple[Tuple[str]]
+    ) -> Tuple[bigquery.SchemaField, ...]:
+        """Format a tuple of tuples schema, cached since it cannot change between uploads"""
+        fields = self._tuple_schemas.get(schema)
+        if fields is None:
+            fields = tuple(self._format_schema_field(item) for item in schema)
+            self._tuple_schemas[schema] = fields
+        return fields
+
+    @staticmethod
+    def _format_schema_field(
+        item: Union[List[str], Tuple[str], Dict[str, str]],
+    ) -> bigquery.SchemaField:
+        """Helper function to format a single schema item for BigQuery
+
+        Args:
+            item: A single column, either as a list or tuple of (name, type, ...) or a JSON representation
+
+        Returns: The formatted schema field
+
+        """
+        if type(item) is list or type(item) is tuple:
+            return bigquery.SchemaField(*item)
+        if type(item) is dict:
+            return bigquery.SchemaField.from_api_repr(item)
+        raise TypeError(
+            f"Unsupported schema item: {item!r}. The schema should preferably be a JSON representation or a List of Lists. For additional information and examples, visit https://cloud.google.com/bigquery/docs/schemas#specifying_a_json_schema_file"
+        )
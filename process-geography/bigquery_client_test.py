@@ -0,0 +1,165 @@
+import pytest
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from unittest import mock
+from google.api_core import exceptions
+from google.cloud import bigquery
+from bigquery_client import BigQueryClient
+
+
+@pytest.fixture
+def client():
+    client = BigQueryClient(project="test-project")
+    client.conn = mock.Mock()
+    client.started_jobs = []
+
+    def start_job(*args, **kwargs):
+        job = mock.Mock()
+        client.started_jobs.append(job)
+        return job
+
+    client.conn.load_table_from_file.side_effect = start_job
+    return client
+
+
+def loaded_tables(client):
+    return [
+        pq.read_table(call.args[0])
+        for call in client.conn.load_table_from_file.call_args_list
+    ]
+
+
+def write_dispositions(client):
+    return [
+        call.kwargs["job_config"].write_disposition
+        for call in client.conn.load_table_from_file.call_args_list
+    ]
+
+
+def test_upload_from_arrow_splits_into_batches(client):
+    table = pa.table({"a": list(range(10))})
+    # int64 rows are 8 bytes, so this fits 4 rows per batch
+    maximum_batch_size_mb = 4 * 8 / (1024 * 1024)
+
+    jobs = client.upload_from_arrow(
+        table,
+        "dataset",
+        "table",
+        "overwrite",
+        maximum_batch_size_mb=maximum_batch_size_mb,
+        wait=False,
+    )
+
+    assert [t.num_rows for t in loaded_tables(client)] == [4, 4, 2]
+    assert write_dispositions(client) == [
+        bigquery.WriteDisposition.WRITE_TRUNCATE,
+        bigquery.WriteDisposition.WRITE_APPEND,
+        bigquery.WriteDisposition.WRITE_APPEND,
+    ]
+    # The truncating batch is awaited; the appends are returned unawaited
+    client.started_jobs[0].result.assert_called_once()
+    assert jobs == client.started_jobs[1:]
+    for job in jobs:
+        job.result.assert_not_called()
+
+
+def test_upload_from_arrow_waits_when_asked(client):
+    jobs = client.upload_from_arrow(
+        pa.table({"a": [1, 2]}), "dataset", "table", "append"
+    )
+
+    assert jobs == []
+    assert write_dispositions(client) == [bigquery.WriteDisposition.WRITE_APPEND]
+    client.started_jobs[0].result.assert_called_once()
+
+
+def test_upload_from_arrow_casts_to_schema(client):
+    table = pa.table({"a": [1, 2], "b": ["x", "y"], "c": ["2024-01-01", None]})
+    schema = (("a", "float"), ("c", "string"))
+
+    client.upload_from_arrow(table, "dataset", "table", "overwrite", schema)
+
+    (loaded,) = loaded_tables(client)
+    assert loaded.schema.field("a").type == pa.float64()
+    assert loaded.schema.field("b").type == pa.string()
+    assert loaded.schema.field("c").type == pa.string()
+
+
+def test_upload_from_arrow_rejects_unknown_schema_field(client):
+    with pytest.raises(ValueError, match="not present in the data: missing"):
+        client.upload_from_arrow(
+            pa.table({"a": [1]}),
+            "dataset",
+            "table",
+            "overwrite",
+            [["missing", "string"]],
+        )
+    client.conn.load_table_from_file.assert_not_called()
+
+
+def test_upload_from_arrow_rejects_unsupported_schema_type(client):
+    with pytest.raises(ValueError, match="Unsupported type NUMERIC for schema field a"):
+        client.upload_from_arrow(
+            pa.table({"a": [1]}), "dataset", "table", "overwrite", [["a", "numeric"]]
+        )
+    client.conn.load_table_from_file.assert_not_called()
+
+
+def test_upload_from_dataframe_loads_through_arrow(client):
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}, index=[5, 6])
+
+    client.upload_from_dataframe(df, "dataset", "table", "overwrite", [["a", "float"]])
+
+    (loaded,) = loaded_tables(client)
+    assert loaded.column_names == ["a", "b"]
+    assert loaded.schema.field("a").type == pa.float64()
+    assert write_dispositions(client) == [bigquery.WriteDisposition.WRITE_TRUNCATE]
+    client.started_jobs[0].result.assert_called_once()
+
+
+@mock.patch("time.sleep")
+def test_upload_from_arrow_reattaches_to_accepted_job(mock_sleep, client):
+    job = mock.Mock()
+    client.conn.load_table_from_file.side_effect = [
+        exceptions.ServiceUnavailable("unavailable"),
+        exceptions.Conflict("already exists"),
+    ]
+    client.conn.get_job.return_value = job
+    client.conn.get_dataset.return_value.location = "europe-west2"
+
+    jobs = client.upload_from_arrow(
+        pa.table({"a": ["x"]}), "dataset", "table", "append", wait=False
+    )
+
+    job_ids = [
+        call.kwargs["job_id"]
+        for call in client.conn.load_table_from_file.call_args_list
+    ]
+    assert job_ids[0] == job_ids[1]
+    assert job_ids[0].startswith("dataset_table_")
+    client.conn.get_dataset.assert_called_once_with(
+        bigquery.DatasetReference("test-project", "dataset")
+    )
+    client.conn.get_job.assert_called_once_with(job_ids[0], location="europe-west2")
+    assert jobs == [job]
+
+
+def test_copy_table_replaces_destination(client):
+    client.copy_table("dataset", "table_staging", "table", "overwrite")
+
+    source, destination = client.conn.copy_table.call_args.args
+    assert (source.table_id, destination.table_id) == ("table_staging", "table")
+    job_config = client.conn.copy_table.call_args.kwargs["job_config"]
+    assert job_config.write_disposition == bigquery.WriteDisposition.WRITE_TRUNCATE
+
+
+def test_table_refs_and_tuple_schemas_are_cached_per_client(client):
+    schema = (("a", "string"),)
+
+    assert client._table_ref("dataset", "table") is client._table_ref(
+        "dataset", "table"
+    )
+    assert client._format_schema(schema) == client._format_schema(schema)
+    assert client._format_tuple_schema(schema) is client._format_tuple_schema(schema)
+    assert BigQueryClient(project="other")._table_refs == {}
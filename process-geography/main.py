@@ -2,22 +2,76 @@ import os
 import requests
 import re
 import logging
+import logging.handlers
 import sys
-import json
+import orjson
 from urllib.parse import urlparse
 from bigquery_client import BigQueryClient
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
 import zipfile
+import csv
+import tempfile
+import shutil
 from datetime import date
-import io
-from typing import Tuple, List, Dict, Any
-import gc
+from typing import (
+    Tuple,
+    List,
+    Dict,
+    Any,
+    BinaryIO,
+    Iterator,
+    Union,
+    Collection,
+    Sequence,
+    Callable,
+)
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextlib
+import functools
+import threading
+import queue
+import atexit
 
 logger = logging.getLogger("primary_logger")
 logger.propagate = False
 project_name = os.environ.get("BIGQUERY_PROJECT_NAME", None)
 dataset_name = os.environ.get("BIGQUERY_DATASET_NAME", None)
+max_workers = int(os.environ.get("MAX_WORKERS", 4))
+max_large_workers = int(os.environ.get("MAX_LARGE_WORKERS", 1))
 client = BigQueryClient(project=project_name)
+# Create a global HTTP session so downloads from the same host reuse connections
+session = requests.Session()
+session.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=max_workers),
+)
+
+# Names of the CSV members to read from multi-file ZIP archives, keyed by table
+_FILE_REGEXES = {
+    "geo_alternate_names_v_2": re.compile(r"alternateNamesV2\.txt"),
+    "geo_geoip_2_city_blocks_ipv6": re.compile(
+        r"GeoIP2-City-CSV_\d{8}/GeoIP2-City-Blocks-IPv6\.csv"
+    ),
+    "geo_geoip_2_city_locations": re.compile(
+        r"GeoIP2-City-CSV_\d{8}/GeoIP2-City-Locations-en\.csv"
+    ),
+    "geo_geoip_2_country_blocks_ipv6": re.compile(
+        r"GeoIP2-Country-CSV_\d{8}/GeoIP2-Country-Blocks-IPv6\.csv"
+    ),
+    "geo_geoip_2_country_locations": re.compile(
+        r"GeoIP2-Country-CSV_\d{8}/GeoIP2-Country-Locations-en\.csv"
+    ),
+}
+
+# ZIP archives read by more than one processor, keyed by URL
+_archive_paths: Dict[str, str] = {}
+_archive_url_locks: Dict[str, threading.Lock] = {}
+_archive_lock = threading.Lock()
+
+# Writes queued log records to stdout off the worker threads
+_log_listener = None
 
 
 class CloudLoggingFormatter(logging.Formatter):
@@ -26,36 +80,65 @@ class CloudLoggingFormatter(logging.Formatter):
     """
 
     def format(self, record: logging.LogRecord) -> str:
-        s = super().format(record)
-        return json.dumps(
+        # A plain record is its own message
+        if (
+            self._fmt == "%(message)s"
+            and not record.args
+            and not record.exc_info
+            and not record.stack_info
+        ):
+            s = str(record.msg)
+        else:
+            s = super().format(record)
+        return orjson.dumps(
             {
                 "message": s,
                 "severity": record.levelname,
-                "timestamp": {"seconds": int(record.created), "nanos": 0},
+                "timestampSeconds": int(record.created),
+                "timestampNanos": 0,
             }
-        )
+        ).decode()
 
 
 def setup_logging():
     """
     Sets up logging for the application.
     """
-    global logger
+    global logger, _log_listener
 
     # Remove any existing handlers
-    if logger.handlers:
-        for handler in logger.handlers:
-            logger.removeHandler(handler)
+    logger.handlers.clear()
+    stop_log_listener()
 
     handler = logging.StreamHandler(stream=sys.stdout)
     formatter = CloudLoggingFormatter(fmt="%(message)s")
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    # The processors log from several threads, so hand records to a queue and
+    # let a single listener thread do the stdout writes
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     logger.setLevel(logging.DEBUG)
+    _log_listener = logging.handlers.QueueListener(log_queue, handler)
+    _log_listener.start()
 
     sys.excepthook = handle_unhandled_exception
 
 
+@atexit.register
+def stop_log_listener():
+    """
+    Flushes any queued log records and stops the listener thread.
+
+    Registered with atexit so records are written when the job exits, including via sys.exit.
+    """
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
 def handle_unhandled_exception(exc_type, exc_value, exc_traceback):
     """
     Handles unhandled exceptions by logging the exception details and sending an alert to the development team.
@@ -82,32 +165,40 @@ def handle_unhandled_exception(exc_type, exc_value, exc_traceback):
     # TODO: Add code to send an alert to the development team
 
 
-def get_authentication(url: str) -> Tuple[Dict[str, str], Any]:
+@functools.lru_cache(maxsize=None)
+def get_geonames_credentials() -> Tuple[str, str]:
+    """Return the GeoNames username and password, read from the environment once."""
+    geonames_username = os.environ.get("GEONAMES_USERNAME", None).strip()
+    geonames_password = os.environ.get("GEONAMES_PASSWORD", None).strip()
+    return geonames_username, geonames_password
+
+
+@functools.lru_cache(maxsize=None)
+def get_maxmind_license_key() -> str:
+    """Return the MaxMind license key, read from the environment once."""
+    return os.environ.get("MAXMIND_LICENSE_KEY", None).strip()
+
+
+def get_authentication(url: str) -> Tuple[str, Any]:
     """Handle authentication for different domains."""
     url_domain = urlparse(url).netloc
-    auth = None
 
     if "geonames" in url_domain:
-        geonames_username = os.environ.get("GEONAMES_USERNAME", None).strip()
-        geonames_password = os.environ.get("GEONAMES_PASSWORD", None).strip()
-        auth = (geonames_username, geonames_password)
-        return url, auth
+        return url, get_geonames_credentials()
     elif "maxmind" in url_domain:
-        maxmind_license_key = os.environ.get("MAXMIND_LICENSE_KEY", None).strip()
-        url = url + f"&license_key={maxmind_license_key}"
-        return url, None
+        return url + f"&license_key={get_maxmind_license_key()}", None
 
-    return url, auth
+    return url, None
 
 
-def get_dtype_mapping() -> Dict[str, str]:
-    """Return the mapping of schema types to pandas dtypes."""
+def get_dtype_mapping() -> Dict[str, pa.DataType]:
+    """Return the mapping of schema types to Arrow types."""
     return {
-        "string": "string",
-        "integer": "Int64",
-        "float": "float64",
-        "object": "string",
-        "date": "string",
+        "string": pa.string(),
+        "integer": pa.int64(),
+        "float": pa.float64(),
+        "object": pa.string(),
+        "date": pa.string(),
     }
 
 
@@ -136,647 +227,950 @@ def get_na_values() -> List[str]:
     ]
 
 
-def create_dtype_dict(schema: list, dtype_mapping: Dict[str, str]) -> Dict[int, str]:
+NA_VALUES = frozenset(get_na_values())
+
+
+def create_dtype_dict(
+    schema: Sequence, dtype_mapping: Dict[str, pa.DataType]
+) -> Dict[int, pa.DataType]:
     """Create a dictionary mapping column indices to their data types."""
     return {i: dtype_mapping[col_type] for i, (_, col_type) in enumerate(schema)}
 
 
-def read_csv_from_bytes(
-    file_bytes: io.BytesIO,
+class InvalidRowCollector:
+    """
+    Invalid row handler for pyarrow.csv that keeps rows with too few fields and skips rows with too many.
+
+    pd.read_csv padded short rows with NA and skipped rows with too many fields. pyarrow can only skip or reject a
+    row, so short rows are collected here for the reader to pad with nulls and add back, and the rest are counted.
+    """
+
+    def __init__(self) -> None:
+        self.short_rows: List[str] = []
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, row: pa_csv.InvalidRow) -> str:
+        # The parser threads may call this concurrently
+        with self._lock:
+            if row.actual_columns < row.expected_columns:
+                self.short_rows.append(row.text)
+            else:
+                self.skipped += 1
+        return "skip"
+
+    def take_short_rows(self) -> List[str]:
+        """Return the short rows collected so far and forget them."""
+        with self._lock:
+            rows, self.short_rows = self.short_rows, []
+        return rows
+
+    def warn(self, url: str, file_name_regex: Union[str, re.Pattern] = None) -> None:
+        """Log a warning if any rows with too many fields were skipped while reading the file."""
+        if not self.skipped:
+            return
+        if file_name_regex is None:
+            logger.warning(
+                "Skipped %d rows with too many fields in %s", self.skipped, url
+            )
+        else:
+            logger.warning(
+                "Skipped %d rows with too many fields in %s member %s",
+                self.skipped,
+                url,
+                getattr(file_name_regex, "pattern", file_name_regex),
+            )
+
+
+def pad_short_rows(
+    rows: List[str], sep: str, schema: pa.Schema, na_values: Collection[str]
+) -> pa.Table:
+    """Parse rows with too few fields into a table of the schema, filling the missing fields with nulls."""
+    columns = [[] for _ in schema]
+    for fields in csv.reader(rows, delimiter=sep):
+        fields += [None] * (len(columns) - len(fields))
+        for column, value in zip(columns, fields):
+            column.append(None if value is None or value in na_values else value)
+    return pa.table(
+        [pa.array(column, pa.string()) for column in columns], names=schema.names
+    ).cast(schema)
+
+
+def csv_options(
+    sep: str,
+    skip_header_rows: int,
+    header: int,
+    dtypes: Dict[int, pa.DataType],
+    num_columns: int,
+    na_values: Collection[str],
+    invalid_row_handler: Callable[[pa_csv.InvalidRow], str] = None,
+) -> Dict[str, Any]:
+    """Build the pyarrow CSV reader options for a file layout and schema.
+
+    Rows with a different number of fields than the first row are passed to invalid_row_handler; without one, they
+    fail the read.
+    """
+    # Names are generated positionally (f0, f1, ...) and only the first
+    # num_columns are kept; a header row, if any, is skipped like pandas does.
+    column_names = [f"f{i}" for i in range(num_columns)]
+    return {
+        "read_options": pa_csv.ReadOptions(
+            skip_rows=skip_header_rows,
+            skip_rows_after_names=0 if header is None else header + 1,
+            autogenerate_column_names=True,
+            # Large blocks give each parser thread enough work on the big files
+            block_size=32 << 20,
+            use_threads=True,
+        ),
+        "parse_options": pa_csv.ParseOptions(
+            delimiter=sep,
+            invalid_row_handler=invalid_row_handler,
+        ),
+        "convert_options": pa_csv.ConvertOptions(
+            column_types={column_names[i]: dtype for i, dtype in dtypes.items()},
+            include_columns=column_names,
+            null_values=na_values,
+            strings_can_be_null=True,
+        ),
+    }
+
+
+def read_csv_to_arrow(
+    file_bytes: BinaryIO,
     sep: str,
     skip_header_rows: int,
     header: int,
-    dtypes: Dict[int, str],
+    dtypes: Dict[int, pa.DataType],
     num_columns: int,
-    na_values: List[str],
-) -> pd.DataFrame:
-    """Read a CSV file from bytes into a pandas DataFrame."""
-    return pd.read_csv(
+    na_values: Collection[str],
+    invalid_rows: InvalidRowCollector = None,
+) -> pa.Table:
+    """Read a CSV file from bytes into an Arrow table.
+
+    With invalid_rows, rows with too few fields are kept with the missing fields set to null, and rows with too many
+    are skipped; without it, either fails the read.
+    """
+    table = pa_csv.read_csv(
         file_bytes,
-        sep=sep,
-        skiprows=skip_header_rows,
-        header=header,
-        on_bad_lines="skip",
-        dtype=dtypes,
-        usecols=range(num_columns),
-        keep_default_na=False,
-        na_values=na_values,
+        **csv_options(
+            sep, skip_header_rows, header, dtypes, num_columns, na_values, invalid_rows
+        ),
     )
+    short_rows = invalid_rows.take_short_rows() if invalid_rows else None
+    if short_rows:
+        table = pa.concat_tables(
+            [table, pad_short_rows(short_rows, sep, table.schema, na_values)]
+        )
+    return table
 
 
-def process_zip_file(
-    zip_ref: zipfile.ZipFile,
-    file_name_regex: str,
+def iter_csv_to_arrow(
+    file_bytes: BinaryIO,
     sep: str,
     skip_header_rows: int,
     header: int,
-    dtypes: Dict[int, str],
+    dtypes: Dict[int, pa.DataType],
     num_columns: int,
-    na_values: List[str],
-) -> pd.DataFrame:
-    """Process a ZIP file and return a DataFrame from the contained CSV."""
+    na_values: Collection[str],
+    chunksize: int,
+    invalid_rows: InvalidRowCollector = None,
+) -> Iterator[pa.Table]:
+    """Read a CSV file from bytes as Arrow tables of about chunksize rows.
+
+    Rows with too few fields are handled as in read_csv_to_arrow and are added to the last table.
+    """
+    reader = pa_csv.open_csv(
+        file_bytes,
+        **csv_options(
+            sep, skip_header_rows, header, dtypes, num_columns, na_values, invalid_rows
+        ),
+    )
+    batches = []
+    num_rows = 0
+    for batch in reader:
+        batches.append(batch)
+        num_rows += batch.num_rows
+        if num_rows >= chunksize:
+            yield pa.Table.from_batches(batches)
+            batches = []
+            num_rows = 0
+
+    short_rows = invalid_rows.take_short_rows() if invalid_rows else None
+    if short_rows:
+        batches += pad_short_rows(
+            short_rows, sep, reader.schema, na_values
+        ).to_batches()
+
+    # An empty file already failed in open_csv, as it did with pd.read_csv,
+    # so the reader has yielded at least one row
+    if batches:
+        yield pa.Table.from_batches(batches, schema=reader.schema)
+
+
+def find_zip_member(
+    zip_ref: zipfile.ZipFile, file_name_regex: Union[str, re.Pattern]
+) -> str:
+    """Return the name of the CSV member to read from a ZIP file."""
     if len(zip_ref.namelist()) == 1:
-        file_name = zip_ref.namelist()[0]
-    else:
-        matched_files = [
-            file_name
-            for file_name in zip_ref.namelist()
-            if re.match(file_name_regex, file_name)
-        ]
-        if not matched_files:
-            raise ValueError("No regex matching file found in the ZIP archive.")
-        file_name = matched_files[0]
-
-    with zip_ref.open(file_name) as extracted_file:
-        return read_csv_from_bytes(
-            io.BytesIO(extracted_file.read()),
+        return zip_ref.namelist()[0]
+
+    pattern = re.compile(file_name_regex)
+    matched_files = [
+        file_name for file_name in zip_ref.namelist() if pattern.fullmatch(file_name)
+    ]
+    if not matched_files:
+        raise ValueError("No regex matching file found in the ZIP archive.")
+    return matched_files[0]
+
+
+def download_archive(url: str) -> str:
+    """Download an archive to a temporary file once per run and return its path."""
+    with _archive_lock:
+        url_lock = _archive_url_locks.setdefault(url, threading.Lock())
+
+    # Processors sharing an archive may ask for it concurrently; the first
+    # one downloads it and the rest wait for the cached path.
+    with url_lock:
+        if url not in _archive_paths:
+            request_url, auth = get_authentication(url)
+            with session.get(request_url, auth=auth, stream=True) as r:
+                r.raise_for_status()
+                r.raw.decode_content = True
+                with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as f:
+                    try:
+                        shutil.copyfileobj(r.raw, f, 1 << 20)
+                    except Exception:
+                        os.remove(f.name)
+                        raise
+            _archive_paths[url] = f.name
+        return _archive_paths[url]
+
+
+def clear_archive_cache():
+    """Delete the archives downloaded by download_archive."""
+    with _archive_lock:
+        for path in _archive_paths.values():
+            os.remove(path)
+        _archive_paths.clear()
+        _archive_url_locks.clear()
+
+
+@contextlib.contextmanager
+def open_download(
+    url: str,
+    file_name_regex: Union[str, re.Pattern] = None,
+    cache_archive: bool = False,
+) -> Iterator[BinaryIO]:
+    """Stream a CSV file from URL, reading it out of the ZIP archive if needed.
+
+    With cache_archive, the ZIP archive is downloaded once per run and shared
+    by every caller of the same URL.
+    """
+    if cache_archive:
+        with zipfile.ZipFile(download_archive(url), "r") as zip_ref:
+            with zip_ref.open(find_zip_member(zip_ref, file_name_regex)) as f:
+                yield f
+        return
+
+    url, auth = get_authentication(url)
+
+    with session.get(url, auth=auth, stream=True) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+
+        if url.endswith(".zip") or "suffix=zip" in url:
+            # ZipFile needs a seekable file, so spool the archive. Large
+            # archives spill to disk instead of being held in memory. The
+            # member itself is streamed so it is never decompressed whole.
+            with tempfile.SpooledTemporaryFile(max_size=64 << 20) as spooled:
+                shutil.copyfileobj(r.raw, spooled, 1 << 20)
+                spooled.seek(0)
+                with zipfile.ZipFile(spooled, "r") as zip_ref:
+                    with zip_ref.open(find_zip_member(zip_ref, file_name_regex)) as f:
+                        yield f
+        else:
+            yield r.raw
+
+
+def load_in_chunks(
+    url: str,
+    schema: Sequence,
+    sep: str = "\t",
+    skip_header_rows: int = 1,
+    header: int = None,
+    file_name_regex: Union[str, re.Pattern] = None,
+    chunksize: int = 250_000,
+    cache_archive: bool = False,
+) -> Iterator[pa.Table]:
+    """Load data from URL as a sequence of Arrow tables of about chunksize rows."""
+    dtypes = create_dtype_dict(schema, get_dtype_mapping())
+    column_names = [col[0] for col in schema]
+    invalid_rows = InvalidRowCollector()
+
+    with open_download(url, file_name_regex, cache_archive) as f:
+        for table in iter_csv_to_arrow(
+            f,
             sep,
             skip_header_rows,
             header,
             dtypes,
-            num_columns,
-            na_values,
-        )
+            len(schema),
+            NA_VALUES,
+            chunksize,
+            invalid_rows,
+        ):
+            yield table.rename_columns(column_names)
+
+    invalid_rows.warn(url, file_name_regex)
+    logger.info("Successfully downloaded and read CSV.")
 
 
-def load_to_dataframe(
+def load_to_arrow(
     url: str,
-    schema: list,
+    schema: Sequence,
     sep: str = "\t",
     skip_header_rows: int = 1,
     header: int = None,
-    file_name_regex: str = None,
-) -> pd.DataFrame:
-    """Main function to load data from URL into a DataFrame."""
-    try:
-        url, auth = get_authentication(url)
-
-        dtype_mapping = get_dtype_mapping()
-        na_values = get_na_values()
-        dtypes = create_dtype_dict(schema, dtype_mapping)
-        num_columns = len(schema)
-
-        with requests.get(url, auth=auth, stream=True) as r:
-            r.raise_for_status()
-            file_bytes = io.BytesIO(r.content)
-
-            # Process the file based on type
-            if url.endswith(".zip") or "suffix=zip" in url:
-                with zipfile.ZipFile(file_bytes, "r") as zip_ref:
-                    df_original = process_zip_file(
-                        zip_ref,
-                        file_name_regex,
-                        sep,
-                        skip_header_rows,
-                        header,
-                        dtypes,
-                        num_columns,
-                        na_values,
-                    )
-            else:
-                df_original = read_csv_from_bytes(
-                    file_bytes,
-                    sep,
-                    skip_header_rows,
-                    header,
-                    dtypes,
-                    num_columns,
-                    na_values,
-                )
-
-        column_names = [col[0] for col in schema]
-        df_original.columns = column_names
-        df = df_original.astype(
-            {col_name: dtype_mapping[col_type] for col_name, col_type in schema}
+    file_name_regex: Union[str, re.Pattern] = None,
+    cache_archive: bool = False,
+) -> pa.Table:
+    """Load data from URL into an Arrow table named and typed by the schema."""
+    dtypes = create_dtype_dict(schema, get_dtype_mapping())
+    invalid_rows = InvalidRowCollector()
+
+    with open_download(url, file_name_regex, cache_archive) as f:
+        table = read_csv_to_arrow(
+            f,
+            sep,
+            skip_header_rows,
+            header,
+            dtypes,
+            len(schema),
+            NA_VALUES,
+            invalid_rows,
         )
 
-        logger.info("Successfully downloaded and read CSV.")
-        return df
+    invalid_rows.warn(url, file_name_regex)
+    logger.info("Successfully downloaded and read CSV.")
+    return table.rename_columns([col[0] for col in schema])
+
+
+def upload_table(
+    table: pa.Table, table_name: str, schema: Sequence, upload_type: str = "overwrite"
+) -> list:
+    """Start loading an Arrow table into the dataset and return its pending load jobs."""
+    # Appending nothing is a no-op, so skip the load job; an empty overwrite
+    # still has to clear the table
+    if upload_type == "append" and table.num_rows == 0:
+        logger.info("Skipping empty %s", table_name)
+        return []
+    return client.upload_from_arrow(
+        table, dataset_name, table_name, upload_type, schema, wait=False
+    )
 
-    except Exception as e:
-        logger.exception(f"Error occurred: {e}")
+
+def upload_in_chunks(
+    chunks: Iterator[pa.Table], table_name: str, schema: Sequence
+) -> list:
+    """
+    Replace a table with a sequence of Arrow tables.
+
+    The chunks are loaded into a staging table, which replaces the table in a single copy job once every chunk has
+    loaded, so a failure partway through leaves the table unchanged. Waits for the loads and the copy, so there are
+    no pending jobs to return, and chunked tables are loaded synchronously rather than through wait_for_load_jobs.
+
+    The staging table is named {table_name}_staging and is deleted afterwards whether or not the load succeeded.
+    """
+    staging_name = f"{table_name}_staging"
+    jobs = []
+    try:
+        # The first chunk replaces the staging table and has to land before
+        # the rest are appended
+        for i, table in enumerate(chunks):
+            if i > 0 and table.num_rows == 0:
+                continue
+            jobs += client.upload_from_arrow(
+                table,
+                dataset_name,
+                staging_name,
+                "overwrite" if i == 0 else "append",
+                schema,
+                wait=i == 0,
+            )
+        for job in jobs:
+            job.result()
+        client.copy_table(dataset_name, staging_name, table_name, "overwrite").result()
+    except Exception:
+        logger.error("Loading %s failed, the table was left unchanged", table_name)
+        # Let appends still running finish so they can't recreate the staging
+        # table after it is deleted
+        for job in jobs:
+            with contextlib.suppress(Exception):
+                job.result()
         raise
+    finally:
+        try:
+            client.delete_table(dataset_name, staging_name)
+        except Exception:
+            logger.exception(
+                "Could not delete staging table %s.%s", dataset_name, staging_name
+            )
+    logger.info("Data uploaded to BigQuery %s.%s", dataset_name, table_name)
+    return []
+
+
+_GEO_ADMIN_1_CODES_SCHEMA = (
+    ("stateprovince_code", "string"),
+    ("stateprovince_name", "string"),
+    ("stateprovince_name_ascii", "string"),
+    ("stateprovince_geoname_id", "string"),
+)
 
 
 def process_geo_admin_1_codes():
     """Process geo_admin_1_codes data."""
     table_name = "geo_admin_1_codes"
     url = "https://www.geonames.org/premiumdata/latest/admin1CodesASCII.txt"
-    schema = [
-        ["stateprovince_code", "string"],
-        ["stateprovince_name", "string"],
-        ["stateprovince_name_ascii", "string"],
-        ["stateprovince_geoname_id", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema, skip_header_rows=0)
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
-    )
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_ADMIN_1_CODES_SCHEMA, skip_header_rows=0)
+    return upload_table(table, table_name, _GEO_ADMIN_1_CODES_SCHEMA)
+
+
+_GEO_ADMIN_2_CODES_SCHEMA = (
+    ("admin2_code", "string"),
+    ("admin2_name", "string"),
+    ("admin2_name_ascii", "string"),
+    ("admin2_geoname_id", "integer"),
+)
 
 
 def process_geo_admin_2_codes():
     """Process geo_admin_2_codes data."""
     table_name = "geo_admin_2_codes"
     url = "https://www.geonames.org/premiumdata/latest/admin2Codes.txt"
-    schema = [
-        ["admin2_code", "string"],
-        ["admin2_name", "string"],
-        ["admin2_name_ascii", "string"],
-        ["admin2_geoname_id", "integer"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema, skip_header_rows=0)
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
-    )
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_ADMIN_2_CODES_SCHEMA, skip_header_rows=0)
+    return upload_table(table, table_name, _GEO_ADMIN_2_CODES_SCHEMA)
+
+
+_GEO_ADMINCODE_5_SCHEMA = (
+    ("admin5_geoname_id", "string"),
+    ("admin5_code", "string"),
+)
 
 
 def process_geo_admincode_5():
     """Process geo_admincode_5 data."""
     table_name = "geo_admin5_code"
     url = "https://www.geonames.org/premiumdata/latest/adminCode5.zip"
-    schema = [
-        ["admin5_geoname_id", "string"],
-        ["admin5_code", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema, skip_header_rows=0)
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
-    )
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_ADMINCODE_5_SCHEMA, skip_header_rows=0)
+    return upload_table(table, table_name, _GEO_ADMINCODE_5_SCHEMA)
+
+
+_GEO_ALL_COUNTRIES_SCHEMA = (
+    ("geoname_id", "string"),
+    ("name", "string"),
+    ("asciiname", "string"),
+    ("alternate_names", "string"),
+    ("latitude", "string"),
+    ("longitude", "string"),
+    ("feature_class", "string"),
+    ("feature_code", "string"),
+    ("country_code", "string"),
+    ("cc2", "string"),
+    ("admin_1_code", "string"),
+    ("admin_2_code", "string"),
+    ("admin_3_code", "string"),
+    ("admin_4_code", "string"),
+    ("population", "string"),
+    ("elevation", "string"),
+    ("dem", "string"),
+    ("timezone", "string"),
+    ("modification_date", "string"),
+)
 
 
 def process_geo_all_countries():
     """Process geo_all_countries data."""
     table_name = "geo_all_countries"
     url = "https://www.geonames.org/premiumdata/latest/allCountries.zip"
-    schema = [
-        ["geoname_id", "string"],
-        ["name", "string"],
-        ["asciiname", "string"],
-        ["alternate_names", "string"],
-        ["latitude", "string"],
-        ["longitude", "string"],
-        ["feature_class", "string"],
-        ["feature_code", "string"],
-        ["country_code", "string"],
-        ["cc2", "string"],
-        ["admin_1_code", "string"],
-        ["admin_2_code", "string"],
-        ["admin_3_code", "string"],
-        ["admin_4_code", "string"],
-        ["population", "string"],
-        ["elevation", "string"],
-        ["dem", "string"],
-        ["timezone", "string"],
-        ["modification_date", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema, skip_header_rows=0)
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
-    )
-    del df
-    gc.collect()
+    logger.info("Processing %s...", table_name)
+    chunks = load_in_chunks(url, _GEO_ALL_COUNTRIES_SCHEMA, skip_header_rows=0)
+    return upload_in_chunks(chunks, table_name, _GEO_ALL_COUNTRIES_SCHEMA)
+
+
+_GEO_ALL_COUNTRIES_DELETED_SCHEMA = (
+    ("geoname_id", "string"),
+    ("name", "string"),
+    ("comment", "string"),
+)
 
 
 def process_geo_all_countries_deleted():
     """Process geo_all_countries_deleted data."""
     table_name = "geo_all_countries_deleted"
     url = "https://www.geonames.org/premiumdata/latest/deletes.txt"
-    schema = [
-        ["geoname_id", "string"],
-        ["name", "string"],
-        ["comment", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema, skip_header_rows=0)
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "append",
-        schema,
-    )
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_ALL_COUNTRIES_DELETED_SCHEMA, skip_header_rows=0)
+    return upload_table(table, table_name, _GEO_ALL_COUNTRIES_DELETED_SCHEMA, "append")
+
+
+_GEO_ALL_COUNTRIES_MODIFIED_SCHEMA = (
+    ("geoname_id", "integer"),
+    ("name", "string"),
+    ("name_ascii", "string"),
+    ("alternate_names", "string"),
+    ("latitude", "float"),
+    ("longitude", "float"),
+    ("feature_class", "string"),
+    ("feature_code", "string"),
+    ("country_code", "string"),
+    ("alternate_country_codes", "string"),
+    ("admin_1_code", "string"),
+    ("admin_2_code", "string"),
+    ("admin_3_code", "string"),
+    ("admin_4_code", "string"),
+    ("population", "integer"),
+    ("elevation", "float"),
+    ("digital_elevation_model", "float"),
+    ("timezone", "string"),
+    ("modification_date", "date"),
+)
 
 
 def process_geo_all_countries_modified():
     """Process geo_all_countries_modified data."""
     table_name = "geo_all_countries_modified"
     url = "https://www.geonames.org/premiumdata/latest/modifications.zip"
-    schema = [
-        ["geoname_id", "integer"],
-        ["name", "string"],
-        ["name_ascii", "string"],
-        ["alternate_names", "string"],
-        ["latitude", "float"],
-        ["longitude", "float"],
-        ["feature_class", "string"],
-        ["feature_code", "string"],
-        ["country_code", "string"],
-        ["alternate_country_codes", "string"],
-        ["admin_1_code", "string"],
-        ["admin_2_code", "string"],
-        ["admin_3_code", "string"],
-        ["admin_4_code", "string"],
-        ["population", "integer"],
-        ["elevation", "float"],
-        ["digital_elevation_model", "float"],
-        ["timezone", "string"],
-        ["modification_date", "date"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema)
-    df["modification_date"] = pd.to_datetime(df["modification_date"]).dt.date
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_ALL_COUNTRIES_MODIFIED_SCHEMA)
+    # Dates are always YYYY-MM-DD, so parse with that format only
+    modification_date = pc.strptime(
+        table["modification_date"], format="%Y-%m-%d", unit="s"
     )
+    table = table.set_column(
+        table.schema.get_field_index("modification_date"),
+        "modification_date",
+        modification_date.cast(pa.date32()),
+    )
+    return upload_table(table, table_name, _GEO_ALL_COUNTRIES_MODIFIED_SCHEMA)
+
+
+_GEO_ALTERNATE_NAMES_DELETED_SCHEMA = (
+    ("alternatename_id", "string"),
+    ("alternatename_geoname_id", "string"),
+    ("alternate_name", "string"),
+)
 
 
 def process_geo_alternate_names_deleted():
     """Process geo_alternate_names_deleted data."""
     table_name = "geo_alternate_names_deleted"
     url = "https://www.geonames.org/premiumdata/latest/alternateNamesDeletes.txt"
-    schema = [
-        ["alternatename_id", "string"],
-        ["alternatename_geoname_id", "string"],
-        ["alternate_name", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema, skip_header_rows=0)
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
-    )
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_ALTERNATE_NAMES_DELETED_SCHEMA, skip_header_rows=0)
+    return upload_table(table, table_name, _GEO_ALTERNATE_NAMES_DELETED_SCHEMA)
+
+
+_GEO_ALTERNATE_NAMES_MODIFIED_SCHEMA = (
+    ("alternatename_id", "string"),
+    ("alternatename_geoname_id", "string"),
+    ("iso_language", "string"),
+    ("alternate_name", "string"),
+)
+# The file has no date column; the load date is added before upload
+_GEO_ALTERNATE_NAMES_MODIFIED_UPLOAD_SCHEMA = _GEO_ALTERNATE_NAMES_MODIFIED_SCHEMA + (
+    ("modification_date", "date"),
+)
 
 
 def process_geo_alternate_names_modified():
     """Process geo_alternate_names_modified data."""
     table_name = "geo_alternate_names_modified"
     url = "https://www.geonames.org/premiumdata/latest/alternateNamesModifications.zip"
-    schema = [
-        ["alternatename_id", "string"],
-        ["alternatename_geoname_id", "string"],
-        ["iso_language", "string"],
-        ["alternate_name", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema, skip_header_rows=0)
-    df["modification_date"] = date.today()
-    schema = [
-        ["alternatename_id", "string"],
-        ["alternatename_geoname_id", "string"],
-        ["iso_language", "string"],
-        ["alternate_name", "string"],
-        ["modification_date", "date"],
-    ]
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_ALTERNATE_NAMES_MODIFIED_SCHEMA, skip_header_rows=0)
+    table = table.append_column(
+        "modification_date",
+        pa.repeat(pa.scalar(date.today(), pa.date32()), table.num_rows),
     )
+    return upload_table(table, table_name, _GEO_ALTERNATE_NAMES_MODIFIED_UPLOAD_SCHEMA)
+
+
+_GEO_ALTERNATE_NAMES_V_2_SCHEMA = (
+    ("alternatename_id", "string"),
+    ("alternatename_geoname_id", "string"),
+    ("iso_language", "string"),
+    ("alternate_name", "string"),
+    ("is_preferred_name", "string"),
+    ("is_short_name", "string"),
+    ("is_colloquial", "string"),
+    ("is_historic", "string"),
+    ("alternatename_start_date", "string"),
+    ("alternatename_end_date", "string"),
+)
 
 
 def process_geo_alternate_names_v_2():
     """Process geo_alternate_names_v_2 data."""
     table_name = "geo_alternate_names_v_2"
     url = "https://www.geonames.org/premiumdata/latest/alternateNamesV2.zip"
-    schema = [
-        ["alternatename_id", "string"],
-        ["alternatename_geoname_id", "string"],
-        ["iso_language", "string"],
-        ["alternate_name", "string"],
-        ["is_preferred_name", "string"],
-        ["is_short_name", "string"],
-        ["is_colloquial", "string"],
-        ["is_historic", "string"],
-        ["alternatename_start_date", "string"],
-        ["alternatename_end_date", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(
-        url, schema, skip_header_rows=0, file_name_regex=r"^alternateNamesV2"
-    )
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
+    logger.info("Processing %s...", table_name)
+    chunks = load_in_chunks(
+        url,
+        _GEO_ALTERNATE_NAMES_V_2_SCHEMA,
+        skip_header_rows=0,
+        file_name_regex=_FILE_REGEXES[table_name],
     )
-    del df
-    gc.collect()
+    return upload_in_chunks(chunks, table_name, _GEO_ALTERNATE_NAMES_V_2_SCHEMA)
+
+
+_GEO_COUNTRY_INFO_SCHEMA = (
+    ("iso_code", "string"),
+    ("iso3_code", "string"),
+    ("iso_numeric_code", "integer"),
+    ("fips_code", "string"),
+    ("country_name", "string"),
+    ("Capital", "string"),
+    ("area_in_square_kilometers", "float"),
+    ("Population", "integer"),
+    ("Continent", "string"),
+    ("top_level_domain", "string"),
+    ("currency_code", "string"),
+    ("currency_name", "string"),
+    ("phone", "string"),
+    ("Postal_Code_Format", "string"),
+    ("Postal_Code_Regex", "string"),
+    ("Languages", "string"),
+    ("country_geoname_id", "integer"),
+    ("neighbors", "string"),
+)
 
 
 def process_geo_country_info():
     """Process geo_country_info data."""
     table_name = "geo_country_info"
     url = "https://www.geonames.org/premiumdata/latest/countryInfo.txt"
-    schema = [
-        ["iso_code", "string"],
-        ["iso3_code", "string"],
-        ["iso_numeric_code", "integer"],
-        ["fips_code", "string"],
-        ["country_name", "string"],
-        ["Capital", "string"],
-        ["area_in_square_kilometers", "float"],
-        ["Population", "integer"],
-        ["Continent", "string"],
-        ["top_level_domain", "string"],
-        ["currency_code", "string"],
-        ["currency_name", "string"],
-        ["phone", "string"],
-        ["Postal_Code_Format", "string"],
-        ["Postal_Code_Regex", "string"],
-        ["Languages", "string"],
-        ["country_geoname_id", "integer"],
-        ["neighbors", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema, skip_header_rows=50)
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
-    )
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_COUNTRY_INFO_SCHEMA, skip_header_rows=50)
+    return upload_table(table, table_name, _GEO_COUNTRY_INFO_SCHEMA)
+
+
+_GEO_FEATURE_CODES_SCHEMA = (
+    ("feature_code_id", "string"),
+    ("feature_code_name", "string"),
+    ("feature_code_description", "string"),
+)
 
 
 def process_geo_feature_codes():
     """Process geo_feature_codes data."""
     table_name = "geo_feature_codes"
     url = "https://www.geonames.org/premiumdata/latest/featureCodes_en.txt"
-    schema = [
-        ["feature_code_id", "string"],
-        ["feature_code_name", "string"],
-        ["feature_code_description", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema, skip_header_rows=0)
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
-    )
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_FEATURE_CODES_SCHEMA, skip_header_rows=0)
+    return upload_table(table, table_name, _GEO_FEATURE_CODES_SCHEMA)
+
+
+_GEO_GEOIP_2_CITY_BLOCKS_IPV6_SCHEMA = (
+    ("network", "string"),
+    ("geoname_id", "integer"),
+    ("registered_country_geoname_id", "integer"),
+    ("represented_country_geoname_id", "integer"),
+    ("is_anonymous_proxy", "integer"),
+    ("is_satellite_provider", "integer"),
+    ("postal_code", "string"),
+    ("latitude", "float"),
+    ("longitude", "float"),
+    ("accuracy_radius", "integer"),
+    ("is_anycast", "integer"),
+)
 
 
 def process_geo_geoip_2_city_blocks_ipv6():
     """Process geo_geoip_2_city_blocks_ipv6 data."""
     table_name = "geo_geoip_2_city_blocks_ipv6"
     url = "https://download.maxmind.com/app/geoip_download?edition_id=GeoIP2-City-CSV&suffix=zip"
-    schema = [
-        ["network", "string"],
-        ["geoname_id", "integer"],
-        ["registered_country_geoname_id", "integer"],
-        ["represented_country_geoname_id", "integer"],
-        ["is_anonymous_proxy", "integer"],
-        ["is_satellite_provider", "integer"],
-        ["postal_code", "string"],
-        ["latitude", "float"],
-        ["longitude", "float"],
-        ["accuracy_radius", "integer"],
-        ["is_anycast", "integer"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(
+    logger.info("Processing %s...", table_name)
+    chunks = load_in_chunks(
         url,
-        schema,
+        _GEO_GEOIP_2_CITY_BLOCKS_IPV6_SCHEMA,
         sep=",",
-        file_name_regex=r"GeoIP2-City-CSV_\d{8}\/GeoIP2-City-Blocks-IPv6.csv",
-    )
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
+        file_name_regex=_FILE_REGEXES[table_name],
+        cache_archive=True,
     )
-    del df
-    gc.collect()
+    return upload_in_chunks(chunks, table_name, _GEO_GEOIP_2_CITY_BLOCKS_IPV6_SCHEMA)
+
+
+_GEO_GEOIP_2_CITY_LOCATIONS_SCHEMA = (
+    ("geoname_id", "integer"),
+    ("locale_code", "string"),
+    ("continent_code", "string"),
+    ("continent_name", "string"),
+    ("country_iso_code", "string"),
+    ("country_name", "string"),
+    ("subdivision_1_iso_code", "string"),
+    ("subdivision_1_name", "string"),
+    ("subdivision_2_iso_code", "string"),
+    ("subdivision_2_name", "string"),
+    ("city_name", "string"),
+    ("metro_code", "string"),
+    ("time_zone", "string"),
+    ("is_in_european_union", "integer"),
+)
 
 
 def process_geo_geoip_2_city_locations():
     """Process geo_geoip_2_city_locations data."""
     table_name = "geo_geoip_2_city_locations"
     url = "https://download.maxmind.com/app/geoip_download?edition_id=GeoIP2-City-CSV&suffix=zip"
-    schema = [
-        ["geoname_id", "integer"],
-        ["locale_code", "string"],
-        ["continent_code", "string"],
-        ["continent_name", "string"],
-        ["country_iso_code", "string"],
-        ["country_name", "string"],
-        ["subdivision_1_iso_code", "string"],
-        ["subdivision_1_name", "string"],
-        ["subdivision_2_iso_code", "string"],
-        ["subdivision_2_name", "string"],
-        ["city_name", "string"],
-        ["metro_code", "string"],
-        ["time_zone", "string"],
-        ["is_in_european_union", "integer"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(
         url,
-        schema,
+        _GEO_GEOIP_2_CITY_LOCATIONS_SCHEMA,
         sep=",",
-        file_name_regex=r"GeoIP2-City-CSV_\d{8}\/GeoIP2-City-Locations-en\.csv",
-    )
-    schema = [
-        ["geoname_id", "integer"],
-        ["locale_code", "string"],
-        ["continent_code", "string"],
-        ["continent_name", "string"],
-        ["country_iso_code", "string"],
-        ["country_name", "string"],
-        ["is_in_european_union", "integer"],
-    ]
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
+        file_name_regex=_FILE_REGEXES[table_name],
+        cache_archive=True,
     )
+    return upload_table(table, table_name, _GEO_GEOIP_2_CITY_LOCATIONS_SCHEMA)
+
+
+_GEO_GEOIP_2_COUNTRY_BLOCKS_IPV6_SCHEMA = (
+    ("network", "string"),
+    ("geoname_id", "integer"),
+    ("registered_country_geoname_id", "integer"),
+    ("represented_country_geoname_id", "integer"),
+    ("is_anonymous_proxy", "integer"),
+    ("is_satellite_provider", "integer"),
+    ("is_anycast", "integer"),
+)
 
 
 def process_geo_geoip_2_country_blocks_ipv6():
     """Process geo_geoip_2_country_blocks_ipv6 data."""
     table_name = "geo_geoip_2_country_blocks_ipv6"
     url = "https://download.maxmind.com/app/geoip_download?edition_id=GeoIP2-Country-CSV&suffix=zip"
-    schema = [
-        ["network", "string"],
-        ["geoname_id", "integer"],
-        ["registered_country_geoname_id", "integer"],
-        ["represented_country_geoname_id", "integer"],
-        ["is_anonymous_proxy", "integer"],
-        ["is_satellite_provider", "integer"],
-        ["is_anycast", "integer"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(
+    logger.info("Processing %s...", table_name)
+    chunks = load_in_chunks(
         url,
-        schema,
+        _GEO_GEOIP_2_COUNTRY_BLOCKS_IPV6_SCHEMA,
         sep=",",
-        file_name_regex=r"GeoIP2-Country-CSV_\d{8}\/GeoIP2-Country-Blocks-IPv6.csv",
+        file_name_regex=_FILE_REGEXES[table_name],
+        cache_archive=True,
     )
-    df = df[df["geoname_id"].notnull()]
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
+    # Drop rows without a geoname_id as each chunk is parsed, so they are
+    # never held in memory together
+    table = pa.concat_tables(
+        [chunk.filter(pc.is_valid(chunk["geoname_id"])) for chunk in chunks]
     )
+    return upload_table(table, table_name, _GEO_GEOIP_2_COUNTRY_BLOCKS_IPV6_SCHEMA)
+
+
+_GEO_GEOIP_2_COUNTRY_LOCATIONS_SCHEMA = (
+    ("geoname_id", "integer"),
+    ("locale_code", "string"),
+    ("continent_code", "string"),
+    ("continent_name", "string"),
+    ("country_iso_code", "string"),
+    ("country_name", "string"),
+    ("is_in_european_union", "integer"),
+)
 
 
 def process_geo_geoip_2_country_locations():
     """Process geo_geoip_2_country_locations data."""
     table_name = "geo_geoip_2_country_locations"
     url = "https://download.maxmind.com/app/geoip_download?edition_id=GeoIP2-Country-CSV&suffix=zip"
-    schema = [
-        ["geoname_id", "integer"],
-        ["locale_code", "string"],
-        ["continent_code", "string"],
-        ["continent_name", "string"],
-        ["country_iso_code", "string"],
-        ["country_name", "string"],
-        ["is_in_european_union", "integer"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(
         url,
-        schema,
+        _GEO_GEOIP_2_COUNTRY_LOCATIONS_SCHEMA,
         sep=",",
-        file_name_regex=r"GeoIP2-Country-CSV_\d{8}\/GeoIP2-Country-Locations-en\.csv",
-    )
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
+        file_name_regex=_FILE_REGEXES[table_name],
+        cache_archive=True,
     )
+    return upload_table(table, table_name, _GEO_GEOIP_2_COUNTRY_LOCATIONS_SCHEMA)
+
+
+_GEO_HIERARCHY_SCHEMA = (
+    ("parent_geoname_id", "integer"),
+    ("child_geoname_id", "integer"),
+    ("hierarchy_type", "string"),
+)
 
 
 def process_geo_hierarchy():
     """Process geo_hierarchy data."""
     table_name = "geo_hierarchy"
     url = "https://www.geonames.org/premiumdata/latest/hierarchy.zip"
-    schema = [
-        ["parent_geoname_id", "integer"],
-        ["child_geoname_id", "integer"],
-        ["hierarchy_type", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema, skip_header_rows=0)
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
-    )
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_HIERARCHY_SCHEMA, skip_header_rows=0)
+    return upload_table(table, table_name, _GEO_HIERARCHY_SCHEMA)
+
+
+_GEO_ISO_LANGUAGE_CODES_SCHEMA = (
+    ("iso_639_3", "string"),
+    ("iso_639_2", "string"),
+    ("iso_639_1", "string"),
+    ("language_name", "string"),
+)
 
 
 def process_geo_iso_language_codes():
     """Process geo_iso_language_codes data."""
     table_name = "geo_iso_language_codes"
     url = "https://www.geonames.org/premiumdata/latest/iso-languagecodes.txt"
-    schema = [
-        ["iso_639_3", "string"],
-        ["iso_639_2", "string"],
-        ["iso_639_1", "string"],
-        ["language_name", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema, skip_header_rows=0)
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
-    )
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_ISO_LANGUAGE_CODES_SCHEMA, skip_header_rows=0)
+    return upload_table(table, table_name, _GEO_ISO_LANGUAGE_CODES_SCHEMA)
+
+
+_GEO_TIME_ZONES_SCHEMA = (
+    ("country_code", "string"),
+    ("time_zone_id", "string"),
+    ("gmt_offset_jan_1", "string"),
+    ("dst_offset_jan_1", "string"),
+    ("raw_offset_independent_of_dst", "string"),
+)
 
 
 def process_geo_time_zones():
     """Process geo_time_zones data."""
     table_name = "geo_time_zones"
     url = "https://www.geonames.org/premiumdata/latest/timeZones.txt"
-    schema = [
-        ["country_code", "string"],
-        ["time_zone_id", "string"],
-        ["gmt_offset_jan_1", "string"],
-        ["dst_offset_jan_1", "string"],
-        ["raw_offset_independent_of_dst", "string"],
-    ]
-    logger.info(f"Processing {table_name}...")
-    df = load_to_dataframe(url, schema)
-    client.upload_from_dataframe(
-        df,
-        dataset_name,
-        table_name,
-        "overwrite",
-        schema,
-    )
+    logger.info("Processing %s...", table_name)
+    table = load_to_arrow(url, _GEO_TIME_ZONES_SCHEMA)
+    return upload_table(table, table_name, _GEO_TIME_ZONES_SCHEMA)
+
+
+PROCESSORS = [
+    process_geo_admin_1_codes,
+    process_geo_admin_2_codes,
+    process_geo_admincode_5,
+    process_geo_all_countries,
+    process_geo_all_countries_deleted,
+    process_geo_all_countries_modified,
+    process_geo_alternate_names_deleted,
+    process_geo_alternate_names_modified,
+    process_geo_alternate_names_v_2,
+    process_geo_country_info,
+    process_geo_geoip_2_city_blocks_ipv6,
+    process_geo_geoip_2_city_locations,
+    process_geo_geoip_2_country_blocks_ipv6,
+    process_geo_geoip_2_country_locations,
+    process_geo_hierarchy,
+    process_geo_feature_codes,
+    process_geo_iso_language_codes,
+    process_geo_time_zones,
+]
+
+# Processors of the largest files, which hold a whole archive and a chunk of
+# the table at once. They run max_large_workers at a time, as the baseline ran
+# every processor one after another.
+LARGE_PROCESSORS = frozenset(
+    {
+        process_geo_all_countries,
+        process_geo_alternate_names_v_2,
+        process_geo_geoip_2_city_blocks_ipv6,
+        process_geo_geoip_2_country_blocks_ipv6,
+    }
+)
+
+
+def wait_for_load_jobs(jobs: List[Tuple[str, Any]]) -> None:
+    """
+    Wait on the load jobs returned by the processors, logging each outcome with its processor and table.
+
+    Every job is waited on even after a failure, so one run reports all failed tables.
+
+    Args:
+        jobs: The (processor name, load job) pairs to wait on
+
+    Raises:
+        RuntimeError: If any load job failed
+    """
+    failed = []
+    for processor_name, job in jobs:
+        destination = f"{job.destination.dataset_id}.{job.destination.table_id}"
+        try:
+            job.result()
+        except Exception:
+            logger.exception(
+                "Load job %s from %s into %s failed",
+                job.job_id,
+                processor_name,
+                destination,
+            )
+            failed.append(destination)
+        else:
+            logger.info(
+                "Data uploaded to BigQuery %s by load job %s from %s",
+                destination,
+                job.job_id,
+                processor_name,
+            )
+    if failed:
+        raise RuntimeError(f"Load jobs failed for {', '.join(sorted(set(failed)))}")
+
+
+def run_processors(processors: Sequence[Callable[[], list]]) -> None:
+    """
+    Run the processors and wait on the load jobs they return.
+
+    Every processor runs and every started load job is waited on even after a failure, so one run reports all
+    failed processors and tables.
+
+    Args:
+        processors: The processors to run
+
+    Raises:
+        RuntimeError: If any processor or load job failed
+    """
+    # Each processor is dominated by its download, so run a bounded number at
+    # once, with the large ones in a smaller pool of their own
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, ThreadPoolExecutor(
+        max_workers=max_large_workers
+    ) as large_executor:
+        futures = {
+            (large_executor if processor in LARGE_PROCESSORS else executor).submit(
+                processor
+            ): processor.__name__
+            for processor in processors
+        }
+        # Processors return their load jobs without waiting on them,
+        # so a worker moves on to the next download while BigQuery loads
+        jobs = []
+        failed = []
+        for future in as_completed(futures):
+            try:
+                jobs += [(futures[future], job) for job in future.result()]
+            except Exception:
+                logger.exception("%s failed", futures[future])
+                failed.append(futures[future])
+
+    errors = []
+    if failed:
+        errors.append(f"Processors failed: {', '.join(sorted(failed))}")
+    try:
+        wait_for_load_jobs(jobs)
+    except RuntimeError as e:
+        errors.append(str(e))
+    if errors:
+        raise RuntimeError("; ".join(errors))
 
 
 def main():
     setup_logging()
     try:
         logger.info("Start processing geography data")
-        process_geo_admin_1_codes()
-        process_geo_admin_2_codes()
-        process_geo_admincode_5()
-        process_geo_all_countries()
-        process_geo_all_countries_deleted()
-        process_geo_all_countries_modified()
-        process_geo_alternate_names_deleted()
-        process_geo_alternate_names_modified()
-        process_geo_alternate_names_v_2()
-        process_geo_country_info()
-        process_geo_geoip_2_city_blocks_ipv6()
-        process_geo_geoip_2_city_locations()
-        process_geo_geoip_2_country_blocks_ipv6()
-        process_geo_geoip_2_country_locations()
-        process_geo_hierarchy()
-        process_geo_feature_codes()
-        process_geo_iso_language_codes()
-        process_geo_time_zones()
+        run_processors(PROCESSORS)
         logger.info("Processing geography data completed")
     except Exception as e:
-        logger.exception(f"Error processing geography data: {str(e)}")
+        logger.exception("Error processing geography data: %s", e)
         sys.exit(1)
+    finally:
+        clear_archive_cache()
 
 
 if __name__ == "__main__":
@@ -1,15 +1,21 @@
 import pytest
 import responses
-import pandas as pd
+import pyarrow as pa
 import io
+import zipfile
 from unittest import mock
 import logging
 import sys
 from main import (
     get_authentication,
-    load_to_dataframe,
-    read_csv_from_bytes,
-    process_zip_file,
+    load_to_arrow,
+    load_in_chunks,
+    read_csv_to_arrow,
+    find_zip_member,
+    upload_table,
+    upload_in_chunks,
+    wait_for_load_jobs,
+    run_processors,
     get_dtype_mapping,
     CloudLoggingFormatter,
 )
@@ -66,90 +72,279 @@ def test_get_authentication_maxmind(mock_env_vars):
 
 def test_get_dtype_mapping():
     dtype_map = get_dtype_mapping()
-    assert dtype_map["string"] == "string"
-    assert dtype_map["integer"] == "Int64"
-    assert dtype_map["float"] == "float64"
+    assert dtype_map["string"] == pa.string()
+    assert dtype_map["integer"] == pa.int64()
+    assert dtype_map["float"] == pa.float64()
 
 
-@mock.patch("pandas.read_csv")
-def test_read_csv_from_bytes(mock_read_csv):
-    mock_df = pd.DataFrame(
-        {"column1": ["a", "b"], "column2": [1, 2], "column3": [1.1, 2.2]}
-    )
-    mock_read_csv.return_value = mock_df
-
-    file_bytes = io.BytesIO(b"dummy,data")
+def test_read_csv_to_arrow():
+    file_bytes = io.BytesIO(b"comment\nc1,c2,c3,c4\na,1,1.1,extra\nNA,,2.2,extra\n")
     sep = ","
     skip_header_rows = 1
     header = 0
-    dtypes = {0: "string", 1: "Int64", 2: "float64"}
+    dtypes = {0: pa.string(), 1: pa.int64(), 2: pa.float64()}
     num_columns = 3
-    na_values = ["NA", ""]
+    na_values = ["", "null"]
 
-    result = read_csv_from_bytes(
+    result = read_csv_to_arrow(
         file_bytes, sep, skip_header_rows, header, dtypes, num_columns, na_values
     )
 
-    mock_read_csv.assert_called_once()
-    assert isinstance(result, pd.DataFrame)
+    assert result.schema.types == [pa.string(), pa.int64(), pa.float64()]
+    assert result.column(0).to_pylist() == ["a", "NA"]
+    assert result.column(1).to_pylist() == [1, None]
 
 
 @responses.activate
-def test_load_to_dataframe(sample_schema):
+def test_load_to_arrow(sample_schema):
     mock_content = b"column1,column2,column3\na,1,1.1\nb,2,2.2"
     responses.add(
         responses.GET, "http://test.com/data.csv", body=mock_content, status=200
     )
 
-    df = load_to_dataframe(
+    table = load_to_arrow(
         url="http://test.com/data.csv",
         schema=sample_schema,
         sep=",",
         skip_header_rows=1,
     )
 
-    assert isinstance(df, pd.DataFrame)
+    assert table.column_names == ["column1", "column2", "column3"]
+    assert table.schema.types == [pa.string(), pa.int64(), pa.float64()]
+    assert table.num_rows == 2
     assert len(responses.calls) == 1
 
 
-@mock.patch("zipfile.ZipFile")
-def test_process_zip_file(mock_zipfile):
-    mock_content = b"column1,column2,column3\na,1,1.1\nb,2,2.2"
+@responses.activate
+def test_load_to_arrow_from_zip(sample_schema):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_ref:
+        zip_ref.writestr("readme.txt", "not the data")
+        zip_ref.writestr("data.txt", "a\t1\t1.1\nb\t2\t2.2\n")
+    responses.add(
+        responses.GET,
+        "http://test.com/data.zip",
+        body=archive.getvalue(),
+        status=200,
+    )
 
-    mock_file = mock.MagicMock()
-    mock_file.__enter__.return_value.read.return_value = mock_content
+    table = load_to_arrow(
+        url="http://test.com/data.zip",
+        schema=sample_schema,
+        skip_header_rows=0,
+        file_name_regex=r"data\.txt",
+    )
 
-    mock_zip = mock.MagicMock()
-    mock_zip.namelist.return_value = ["test.csv"]
-    mock_zip.open.return_value = mock_file
-    mock_zipfile.return_value = mock_zip
+    assert table.column("column1").to_pylist() == ["a", "b"]
+
+
+@responses.activate
+def test_load_in_chunks(sample_schema):
+    responses.add(
+        responses.GET,
+        "http://test.com/data.txt",
+        body=b"a\t1\t1.1\nb\t\t2.2\n",
+        status=200,
+    )
+
+    tables = list(
+        load_in_chunks(
+            url="http://test.com/data.txt", schema=sample_schema, skip_header_rows=0
+        )
+    )
+
+    table = pa.concat_tables(tables)
+    assert table.column_names == ["column1", "column2", "column3"]
+    assert table.column("column2").to_pylist() == [1, None]
+
+
+@responses.activate
+def test_load_to_arrow_pads_short_rows_and_skips_long_rows(sample_schema, caplog):
+    mock_content = b"a\t1\t1.1\nb\t2\nc\t3\t3.3\td\ne\t5\t5.5\n"
+    responses.add(
+        responses.GET, "http://test.com/data.txt", body=mock_content, status=200
+    )
+
+    table = load_to_arrow(
+        url="http://test.com/data.txt", schema=sample_schema, skip_header_rows=0
+    )
+
+    assert table.to_pylist() == [
+        {"column1": "a", "column2": 1, "column3": 1.1},
+        {"column1": "e", "column2": 5, "column3": 5.5},
+        {"column1": "b", "column2": 2, "column3": None},
+    ]
+    assert any(
+        "Skipped 1 rows with too many fields in http://test.com/data.txt"
+        in record.message
+        for record in caplog.records
+    )
+
+
+@responses.activate
+def test_load_in_chunks_pads_short_rows(sample_schema):
+    responses.add(
+        responses.GET,
+        "http://test.com/data.txt",
+        body=b"a\t1\t1.1\nb\nc\t3\t3.3\n",
+        status=200,
+    )
 
-    dtypes = {0: "string", 1: "Int64", 2: "float64"}
-    result = process_zip_file(mock_zip, r"test\.csv", ",", 1, 0, dtypes, 3, ["NA", ""])
+    tables = list(
+        load_in_chunks(
+            url="http://test.com/data.txt",
+            schema=sample_schema,
+            skip_header_rows=0,
+            chunksize=1,
+        )
+    )
 
-    assert isinstance(result, pd.DataFrame)
-    assert mock_zip.namelist.call_count == 2
-    mock_zip.open.assert_called_once_with("test.csv")
+    table = pa.concat_tables(tables)
+    assert table.column("column1").to_pylist() == ["a", "c", "b"]
+    assert table.column("column2").to_pylist() == [1, 3, None]
 
 
-def test_process_zip_file_no_matching_file():
+def test_find_zip_member_no_matching_file():
     mock_zip = mock.MagicMock()
     mock_zip.namelist.return_value = ["some_other_file.txt", "wrong.csv"]
 
-    dtypes = {0: "string", 1: "Int64", 2: "float64"}
     with pytest.raises(
         ValueError, match="No regex matching file found in the ZIP archive"
     ):
-        process_zip_file(
-            mock_zip,
-            r"test\.csv$",
-            ",",
-            1,
-            0,
-            dtypes,
-            3,
-            ["NA", ""],
-        )
+        find_zip_member(mock_zip, r"test\.csv")
 
-    assert mock_zip.namelist.call_count == 2
     mock_zip.open.assert_not_called()
+
+
+def test_find_zip_member_requires_a_full_name_match():
+    pattern = r"GeoIP2-City-CSV_\d{8}/GeoIP2-City-Blocks-IPv6\.csv"
+    mock_zip = mock.MagicMock()
+    mock_zip.namelist.return_value = [
+        "GeoIP2-City-CSV_20240101/GeoIP2-City-Blocks-IPv6.csv.bak",
+        "GeoIP2-City-CSV_20240101/GeoIP2-City-Blocks-IPv6.csv",
+    ]
+
+    assert (
+        find_zip_member(mock_zip, pattern)
+        == "GeoIP2-City-CSV_20240101/GeoIP2-City-Blocks-IPv6.csv"
+    )
+
+    # A prefix match is no longer enough
+    mock_zip.namelist.return_value = [
+        "GeoIP2-City-CSV_20240101/GeoIP2-City-Blocks-IPv6.csv.bak",
+        "GeoIP2-City-CSV_20240101/README.txt",
+    ]
+    with pytest.raises(
+        ValueError, match="No regex matching file found in the ZIP archive"
+    ):
+        find_zip_member(mock_zip, pattern)
+
+
+@mock.patch("main.client")
+def test_upload_table_skips_empty_append(mock_client, sample_schema):
+    table = pa.table({"column1": pa.array([], pa.string())})
+
+    assert upload_table(table, "test_table", sample_schema, "append") == []
+    mock_client.upload_from_arrow.assert_not_called()
+
+
+@mock.patch("main.client")
+def test_upload_table_overwrites_without_waiting(mock_client, sample_schema):
+    table = pa.table({"column1": pa.array([], pa.string())})
+    mock_client.upload_from_arrow.return_value = ["job"]
+
+    assert upload_table(table, "test_table", sample_schema) == ["job"]
+    args, kwargs = mock_client.upload_from_arrow.call_args
+    assert args[2:] == ("test_table", "overwrite", sample_schema)
+    assert kwargs == {"wait": False}
+
+
+@mock.patch("main.dataset_name", "geography")
+@mock.patch("main.client")
+def test_upload_in_chunks_swaps_in_a_staging_table(mock_client, sample_schema):
+    chunks = [
+        pa.table({"column1": ["a"]}),
+        pa.table({"column1": ["b"]}),
+        pa.table({"column1": pa.array([], pa.string())}),
+    ]
+    append_job = mock.Mock()
+    mock_client.upload_from_arrow.side_effect = [[], [append_job]]
+
+    jobs = upload_in_chunks(iter(chunks), "test_table", sample_schema)
+
+    assert jobs == []
+    calls = mock_client.upload_from_arrow.call_args_list
+    assert [call.args[1:4] for call in calls] == [
+        ("geography", "test_table_staging", "overwrite"),
+        ("geography", "test_table_staging", "append"),
+    ]
+    assert [call.kwargs["wait"] for call in calls] == [True, False]
+    append_job.result.assert_called_once()
+    mock_client.copy_table.assert_called_once_with(
+        "geography", "test_table_staging", "test_table", "overwrite"
+    )
+    mock_client.delete_table.assert_called_once_with("geography", "test_table_staging")
+
+
+@mock.patch("main.dataset_name", "geography")
+@mock.patch("main.client")
+def test_upload_in_chunks_leaves_table_unchanged_on_failure(mock_client, sample_schema):
+    failed_job = mock.Mock()
+    failed_job.result.side_effect = ValueError("load failed")
+    mock_client.upload_from_arrow.side_effect = [[], [failed_job]]
+    chunks = [pa.table({"column1": ["a"]}), pa.table({"column1": ["b"]})]
+
+    with pytest.raises(ValueError):
+        upload_in_chunks(iter(chunks), "test_table", sample_schema)
+
+    mock_client.copy_table.assert_not_called()
+    mock_client.delete_table.assert_called_once_with("geography", "test_table_staging")
+
+
+def mock_load_job(job_id, table_id, error=None):
+    job = mock.Mock(job_id=job_id)
+    job.destination.dataset_id = "geography"
+    job.destination.table_id = table_id
+    job.result.side_effect = error
+    return job
+
+
+def test_wait_for_load_jobs_reports_each_table(caplog):
+    jobs = [
+        ("process_geo_a", mock_load_job("job_a", "geo_a", ValueError("bad rows"))),
+        ("process_geo_b", mock_load_job("job_b", "geo_b")),
+    ]
+
+    with pytest.raises(RuntimeError, match="geography.geo_a"):
+        wait_for_load_jobs(jobs)
+
+    messages = [record.message for record in caplog.records]
+    assert "Load job job_a from process_geo_a into geography.geo_a failed" in messages
+    assert (
+        "Data uploaded to BigQuery geography.geo_b by load job job_b from process_geo_b"
+        in messages
+    )
+
+
+def test_run_processors_reports_every_failure(caplog):
+    load_job = mock_load_job("job_b", "geo_b", ValueError("bad rows"))
+
+    def process_geo_a():
+        raise ValueError("download failed")
+
+    def process_geo_b():
+        return [load_job]
+
+    def process_geo_c():
+        return []
+
+    with pytest.raises(RuntimeError) as excinfo:
+        run_processors([process_geo_a, process_geo_b, process_geo_c])
+
+    assert str(excinfo.value) == (
+        "Processors failed: process_geo_a; Load jobs failed for geography.geo_b"
+    )
+    load_job.result.assert_called_once()
+    messages = [record.message for record in caplog.records]
+    assert "process_geo_a failed" in messages
+    assert "Load job job_b from process_geo_b into geography.geo_b failed" in messages